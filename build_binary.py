@@ -33,11 +33,21 @@ def build_binary():
             "--clean",
             "--hidden-import=click",
             "--hidden-import=somnia_contract_auditor",
+            "--hidden-import=somnia_contract_auditor.cache",
             "--hidden-import=somnia_contract_auditor.cli",
             "--hidden-import=somnia_contract_auditor.file_discovery",
+            "--hidden-import=somnia_contract_auditor.json_backend",
+            "--hidden-import=somnia_contract_auditor.process",
             "--hidden-import=somnia_contract_auditor.slither_runner",
             "--hidden-import=somnia_contract_auditor.solhint_runner",
             "--hidden-import=somnia_contract_auditor.report_generator",
+            "--hidden-import=somnia_contract_auditor.ai_assistant",
+            f"--add-data={src_dir / 'somnia_contract_auditor' / 'solhint_daemon.js'}{os.pathsep}somnia_contract_auditor",
+            "--exclude-module=slither",
+            # Standard library packages the CLI never uses
+            "--exclude-module=tkinter",
+            "--exclude-module=unittest",
+            "--exclude-module=pydoc",
             f"--paths={src_dir}",
             str(entry_point),
         ]
@@ -15,8 +15,12 @@ else:
 
 sys.path.insert(0, src_path)
 
+import multiprocessing
+
 from somnia_contract_auditor.cli import main
 
 if __name__ == "__main__":
+    # Solhint worker processes are spawned by re-running the executable
+    multiprocessing.freeze_support()
     main()
 
@@ -0,0 +1,104 @@
+"""Check that the mypyc build produces the same output as the pure-Python modules.
+
+Builds ai_assistant and report_generator with SOMNIA_AUDITOR_MYPYC=1 into a
+temporary directory, then generates a report and the AI prompts for the same
+findings with both builds and compares them byte for byte.
+
+Usage: python scripts/check_native_build.py (requires mypy and wheel)
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+# Run in a fresh interpreter for each build; prints which build it loaded
+# and writes the report and prompts to the path given as the argument
+SAMPLE = r'''
+import sys
+from datetime import datetime
+from somnia_contract_auditor import ai_assistant, report_generator
+
+all_results = {}
+for i in range(300):
+    slither_results = {
+        "vulnerabilities": [
+            {"issue": f"Reentrancy in withdraw{i}() é", "severity": "High", "location": f"F{i}.sol:[{i}, {i + 1}]"}
+        ] * (i % 4),
+        "inefficiencies": [{"issue": "Gas optimization", "severity": "Optimization", "location": f"F{i}.sol:[3]"}],
+        "best_practices": [],
+    }
+    if i % 17 == 0:
+        slither_results = {"error": "Compilation failed"}
+    solhint_results = {
+        "best_practices": [{"issue": "Compiler version must be fixed", "severity": "Warning", "location": f"F{i}.sol:1:1"}]
+    }
+    all_results[f"/project/contracts/F{i}.sol"] = (slither_results, solhint_results)
+
+report_path = sys.argv[1]
+report_generator.generate_report(
+    all_results, list(all_results), output_file=report_path, ai_summary="Summary", now=datetime(2025, 1, 1)
+)
+with open(report_path, "ab") as f:
+    for files, findings in ai_assistant._chunk_results(all_results):
+        for message in ai_assistant._build_prompt(findings, files):
+            f.write(message["content"].encode("utf-8"))
+
+print(report_generator.__file__)
+'''
+
+
+def run_sample(pythonpath: str, output_file: str) -> str:
+    """Run the sample with the given import path and return the module it loaded."""
+    env = dict(os.environ, PYTHONPATH=pythonpath)
+    result = subprocess.run(
+        [sys.executable, "-c", SAMPLE, output_file],
+        env=env, check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+def check_native_build():
+    """Build the mypyc modules and compare their output with pure Python."""
+    project_root = Path(__file__).resolve().parent.parent
+
+    with tempfile.TemporaryDirectory() as tmp:
+        target = os.path.join(tmp, "native")
+        print("Building mypyc modules...")
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install", "--quiet", "--no-build-isolation",
+                 "--no-deps", "--target", target, str(project_root)],
+                env=dict(os.environ, SOMNIA_AUDITOR_MYPYC="1"),
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"\n✗ Build failed with exit code {e.returncode}")
+            return e.returncode
+
+        native_output = os.path.join(tmp, "native.md")
+        python_output = os.path.join(tmp, "python.md")
+        native_module = run_sample(target, native_output)
+        python_module = run_sample(str(project_root / "src"), python_output)
+
+        if native_module.endswith(".py"):
+            print(f"✗ The build did not produce compiled modules (loaded {native_module})")
+            return 1
+
+        with open(native_output, "rb") as f:
+            native_bytes = f.read()
+        with open(python_output, "rb") as f:
+            python_bytes = f.read()
+
+        if native_bytes != python_bytes:
+            print(f"✗ Output differs: compiled {len(native_bytes)} bytes, pure Python {len(python_bytes)} bytes")
+            return 1
+
+    print(f"✓ Compiled and pure-Python builds produce identical output ({len(python_bytes)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(check_native_build())
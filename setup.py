@@ -1,6 +1,32 @@
 """Setup script for backward compatibility with pip install."""
 
+import os
+
 from setuptools import setup
 
-setup()
+ext_modules = []
+
+# Opt-in native build of the formatting-heavy modules:
+#   pip install mypy && SOMNIA_AUDITOR_MYPYC=1 pip install --no-build-isolation .
+if os.environ.get("SOMNIA_AUDITOR_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        # The mypy overrides in pyproject.toml also cover modules that are not
+        # compiled, which warn_unused_configs would otherwise reject
+        "--no-warn-unused-configs",
+        "src/somnia_contract_auditor/ai_assistant.py",
+        "src/somnia_contract_auditor/report_generator.py",
+    ])
+
+# Opt-in native build of Slither finding classification:
+#   pip install cython && SOMNIA_AUDITOR_CYTHON=1 pip install --no-build-isolation .
+if os.environ.get("SOMNIA_AUDITOR_CYTHON") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules += cythonize(
+        ["src/somnia_contract_auditor/_classify.pyx"],
+        compiler_directives={"language_level": "3"},
+    )
 
+setup(ext_modules=ext_modules)
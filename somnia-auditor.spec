@@ -14,12 +14,15 @@ a = Analysis(
     [str(entry_point)],
     pathex=[str(src_dir)],
     binaries=[],
-    datas=[],
+    datas=[(str(src_dir / 'somnia_contract_auditor' / 'solhint_daemon.js'), 'somnia_contract_auditor')],
     hiddenimports=[
         'click',
         'somnia_contract_auditor',
+        'somnia_contract_auditor.cache',
         'somnia_contract_auditor.cli',
         'somnia_contract_auditor.file_discovery',
+        'somnia_contract_auditor.json_backend',
+        'somnia_contract_auditor.process',
         'somnia_contract_auditor.slither_runner',
         'somnia_contract_auditor.solhint_runner',
         'somnia_contract_auditor.report_generator',
@@ -28,7 +31,9 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Slither is optional at runtime and far too large to bundle; the
+    # standard library packages below are never used by the CLI
+    excludes=['slither', 'tkinter', 'unittest', 'pydoc'],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -0,0 +1,52 @@
+# cython: language_level=3
+"""Compiled version of slither_runner._classify, built when Cython is available."""
+
+import re
+
+
+# Keep in sync with slither_runner._VULN_RE and _INEFF_RE
+_VULN_RE = re.compile(r"reentrancy|vulnerability", re.IGNORECASE)
+_INEFF_RE = re.compile(r"gas|optimization", re.IGNORECASE)
+
+
+cdef str _categorize(str description):
+    if _VULN_RE.search(description):
+        return "vulnerability"
+    if _INEFF_RE.search(description):
+        return "inefficiency"
+    return "best_practice"
+
+
+def classify(list details):
+    """
+    Build findings from detector details and split them by category.
+
+    Args:
+        details: (description, impact, filename, lines) tuples
+
+    Returns:
+        Tuple of (vulnerabilities, inefficiencies, best_practices) lists
+    """
+    cdef list vulnerabilities = []
+    cdef list inefficiencies = []
+    cdef list best_practices = []
+    cdef str description
+    cdef str category
+    cdef dict finding
+
+    for description, impact, filename, lines in details:
+        category = _categorize(description)
+        finding = {
+            "issue": description,
+            "severity": impact,
+            "location": f"{filename}:{lines}",
+            "category": category
+        }
+        if category == "vulnerability":
+            vulnerabilities.append(finding)
+        elif category == "inefficiency":
+            inefficiencies.append(finding)
+        else:
+            best_practices.append(finding)
+
+    return vulnerabilities, inefficiencies, best_practices
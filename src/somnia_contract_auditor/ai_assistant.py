@@ -2,50 +2,115 @@
 
 import os
 import json
-from typing import Dict, Tuple, Any, List
+import asyncio
+from typing import Dict, Tuple, Any, List, Optional
 
 
-def _build_prompt(
-    all_results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]],
-    sol_files: List[str]
-) -> List[Dict[str, str]]:
+# Maximum number of tokens of findings text sent to the model
+PROMPT_TOKEN_BUDGET = 6000
+
+# Maximum number of OpenAI requests in flight at once
+AI_MAX_CONCURRENCY = 20
+
+# Slither result categories, in report order
+_SLITHER_CATEGORIES = ("vulnerabilities", "inefficiencies", "best_practices")
+
+
+def _fmt_issue(src: str, issue: Dict[str, Any]) -> str:
+    """Format a single finding as a prompt line."""
+    return f"- [{issue.get('severity','Info')}] {issue.get('issue','')} @ {src} ({issue.get('location','')})"
+
+
+def _flatten_findings(all_results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]) -> str:
     """
-    Build a system/user prompt for the AI summarization based on tool outputs.
+    Flatten findings into a compact textual description, one issue per line.
     """
-    system_prompt = (
-        "You are a senior smart contract security auditor. "
-        "Summarize the combined Slither and Solhint findings, prioritize by risk, "
-        "and propose concrete, code-level remediation steps. "
-        "Group results by: Critical/High, Medium, Low/Informational, and Style/Best Practices. "
-        "Prefer concise, actionable guidance. Where helpful, include short Solidity snippets."
-    )
-
-    # Flatten findings into a compact textual description
-    def fmt_issue(src: str, issue: Dict[str, Any]) -> str:
-        return f"- [{issue.get('severity','Info')}] {issue.get('issue','')} @ {src} ({issue.get('location','')})"
+    # Size the line list up front and fill it by index
+    total = 0
+    for slither_results, solhint_results in all_results.values():
+        if isinstance(slither_results, dict):
+            if "error" in slither_results:
+                total += 1
+            else:
+                for cat in _SLITHER_CATEGORIES:
+                    total += len(slither_results.get(cat, []))
+        if isinstance(solhint_results, dict):
+            if "error" in solhint_results:
+                total += 1
+            else:
+                total += len(solhint_results.get("best_practices", []))
 
-    lines: List[str] = []
+    lines: List[str] = [""] * total
+    i = 0
     for file_path, (slither_results, solhint_results) in all_results.items():
-        src = os.path.basename(file_path)
+        src: str = os.path.basename(file_path)
         # Slither issues
         if isinstance(slither_results, dict):
             if "error" in slither_results:
-                lines.append(f"Slither Error in {src}: {slither_results['error']}")
+                lines[i] = f"Slither Error in {src}: {slither_results['error']}"
+                i += 1
             else:
-                for cat in ("vulnerabilities", "inefficiencies", "best_practices"):
+                for cat in _SLITHER_CATEGORIES:
                     for issue in slither_results.get(cat, []):
-                        lines.append(fmt_issue(src, issue))
+                        lines[i] = _fmt_issue(src, issue)
+                        i += 1
         # Solhint issues
         if isinstance(solhint_results, dict):
             if "error" in solhint_results:
-                lines.append(f"Solhint Error in {src}: {solhint_results['error']}")
+                lines[i] = f"Solhint Error in {src}: {solhint_results['error']}"
+                i += 1
             else:
                 for issue in solhint_results.get("best_practices", []):
-                    lines.append(fmt_issue(src, issue))
+                    lines[i] = _fmt_issue(src, issue)
+                    i += 1
+
+    return "\n".join(lines)
+
+
+def _truncate_to_budget(text: str, model: str, budget: int = PROMPT_TOKEN_BUDGET) -> str:
+    """
+    Cut text down to at most budget tokens for the given model.
+    Uses tiktoken when installed, otherwise assumes about four characters per token.
+    """
+    # Every token covers at least one character
+    if len(text) <= budget:
+        return text
+
+    note = "\n... (findings truncated)"
+    try:
+        import tiktoken
+        encoding = tiktoken.encoding_for_model(model)
+    except (ImportError, KeyError):
+        limit = budget * 4
+        return text if len(text) <= limit else text[:limit] + note
+
+    tokens = encoding.encode(text)
+    if len(tokens) <= budget:
+        return text
+    truncated: str = encoding.decode(tokens[:budget])
+    return truncated + note
+
+
+def _build_prompt(
+    findings: str,
+    sol_files: List[str],
+    model: str = "gpt-4o-mini"
+) -> List[Dict[str, str]]:
+    """
+    Build a system/user prompt for the AI summarization from flattened findings.
+    Findings beyond PROMPT_TOKEN_BUDGET tokens for the model are dropped.
+    """
+    system_prompt = (
+        "You are a senior smart contract security auditor. "
+        "Summarize the combined Slither and Solhint findings, prioritize by risk, "
+        "and propose concrete, code-level remediation steps. "
+        "Group results by: Critical/High, Medium, Low/Informational, and Style/Best Practices. "
+        "Prefer concise, actionable guidance. Where helpful, include short Solidity snippets."
+    )
 
     user_prompt = (
         "Project files: " + ", ".join(os.path.basename(p) for p in sol_files) + "\n\n" +
-        "Findings (Slither + Solhint):\n" + "\n".join(lines)
+        "Findings (Slither + Solhint):\n" + _truncate_to_budget(findings, model)
     )
 
     return [
@@ -54,18 +119,54 @@ def _build_prompt(
     ]
 
 
-def generate_ai_summary(
+def _chunk_results(
+    all_results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]],
+    budget: int = PROMPT_TOKEN_BUDGET
+) -> List[Tuple[List[str], str]]:
+    """
+    Split results into groups of files whose findings fit in one prompt.
+    Returns (file paths, flattened findings) per group, so each file's
+    findings are formatted once. Sizes are estimated at about four characters
+    per token; a single file over budget gets a group of its own and is
+    truncated when prompted.
+    """
+    limit = budget * 4
+    chunks: List[Tuple[List[str], str]] = []
+    files: List[str] = []
+    texts: List[str] = []
+    size = 0
+    for file_path, results in all_results.items():
+        text = _flatten_findings({file_path: results})
+        file_size = len(text) + 1
+        if files and size + file_size > limit:
+            chunks.append((files, "\n".join(texts)))
+            files = []
+            texts = []
+            size = 0
+        files.append(file_path)
+        # Files without findings add no lines
+        if text:
+            texts.append(text)
+        size += file_size
+    if files:
+        chunks.append((files, "\n".join(texts)))
+    return chunks
+
+
+async def generate_ai_summary_async(
     all_results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]],
     sol_files: List[str],
     model: str = "gpt-4o-mini",
-    api_key: str = None,
+    api_key: Optional[str] = None,
 ) -> str:
     """
     Send Slither/Solhint results to OpenAI and return a concise markdown summary.
+    Findings too large for one prompt are split into chunks that are summarized
+    concurrently, at most AI_MAX_CONCURRENCY at a time, and concatenated.
     Requires environment variable OPENAI_API_KEY or explicit api_key.
     """
     try:
-        from openai import OpenAI
+        from openai import AsyncOpenAI
     except Exception as e:
         return (
             "AI summary unavailable: OpenAI SDK not installed. "
@@ -79,19 +180,53 @@ def generate_ai_summary(
             "Set it in the environment or pass --api-key."
         )
 
-    client = OpenAI(api_key=key)
-    messages = _build_prompt(all_results, sol_files)
+    chunks = _chunk_results(all_results)
+    if len(chunks) <= 1:
+        findings = chunks[0][1] if chunks else ""
+        prompts = [_build_prompt(findings, sol_files, model=model)]
+    else:
+        prompts = [_build_prompt(findings, files, model=model) for files, findings in chunks]
 
-    try:
-        completion = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=0.2,
-            max_tokens=900,
-        )
-        content = completion.choices[0].message.content or ""
-        return content.strip()
-    except Exception as e:
-        return f"AI summary failed: {str(e)}"
+    semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+
+    async with AsyncOpenAI(api_key=key) as client:
+        async def summarize(messages: List[Dict[str, str]]) -> str:
+            async with semaphore:
+                completion = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=0.2,
+                    max_tokens=900,
+                )
+            content = completion.choices[0].message.content or ""
+            return content.strip()
+
+        responses = await asyncio.gather(*[summarize(m) for m in prompts], return_exceptions=True)
+
+    if len(responses) == 1:
+        response = responses[0]
+        if isinstance(response, BaseException):
+            return f"AI summary failed: {str(response)}"
+        return response
 
+    sections: List[str] = []
+    for (files, _), response in zip(chunks, responses):
+        heading = "### " + ", ".join(os.path.basename(p) for p in files)
+        if isinstance(response, BaseException):
+            sections.append(f"{heading}\n\nAI summary failed: {str(response)}")
+        else:
+            sections.append(f"{heading}\n\n{response}")
+    return "\n\n".join(sections)
 
+
+def generate_ai_summary(
+    all_results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]],
+    sol_files: List[str],
+    model: str = "gpt-4o-mini",
+    api_key: Optional[str] = None,
+) -> str:
+    """
+    Blocking wrapper around generate_ai_summary_async.
+    Must not be called from a running event loop.
+    """
+    return asyncio.run(generate_ai_summary_async(all_results, sol_files, model=model, api_key=api_key))
@@ -0,0 +1,186 @@
+"""On-disk cache of tool results keyed by file contents."""
+
+import functools
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from . import json_backend
+
+
+# Root directory for cached results, one subdirectory per tool
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "somnia-auditor"
+
+_enabled = True
+
+# Results loaded or stored during this run, so repeated lookups skip the disk
+_memory: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+
+def set_enabled(enabled: bool) -> None:
+    """
+    Enable or disable the result cache for this process.
+
+    Args:
+        enabled: Whether cached results may be read and written
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """Return whether the result cache is enabled for this process."""
+    return _enabled
+
+
+@functools.lru_cache(maxsize=None)
+def tool_version(tool: str) -> Optional[str]:
+    """
+    Return the version string reported by a tool, or None if it cannot be run.
+
+    Args:
+        tool: Executable name (e.g. "slither" or "solhint")
+    """
+    try:
+        output = subprocess.check_output([tool, "--version"], stderr=subprocess.DEVNULL, timeout=60)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.decode("utf-8", errors="replace").strip()
+
+
+def cache_key(tool: str, file_path: str, extra: bytes = b"") -> Optional[str]:
+    """
+    Compute the cache key for running a tool on a file.
+
+    The key covers the file contents and the tool version, so editing the file
+    or upgrading the tool invalidates earlier results. The path is included
+    too because findings embed it in their locations.
+
+    Args:
+        tool: Executable name of the analysis tool
+        file_path: Path to the analyzed file
+        extra: Other inputs the result depends on, such as the tool's config
+
+    Returns:
+        Hex digest, or None when caching is disabled or not possible
+    """
+    if not _enabled:
+        return None
+
+    contents = file_digest(file_path)
+    version = tool_version(tool)
+    if contents is None or version is None:
+        return None
+
+    digest = hashlib.blake2b()
+    for part in (version, os.path.abspath(file_path), file_path, contents):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    if extra:
+        digest.update(extra)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def file_digest(file_path: str) -> Optional[str]:
+    """
+    Return a hex digest of a file's contents, or None if it cannot be read.
+
+    Files are only re-read and re-hashed when their stat info changes.
+
+    Args:
+        file_path: Path to the file
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return _file_digest(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_digest(file_path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Hash a file for file_digest(); the stat fields only key the memoization."""
+    try:
+        with open(file_path, "rb") as f:
+            contents = f.read()
+    except OSError:
+        return None
+    return hashlib.blake2b(contents).hexdigest()
+
+
+def files_digest(file_paths: Iterable[str]) -> str:
+    """
+    Return a hex digest of the paths and contents of a set of files.
+
+    The order of file_paths does not matter. Files that cannot be read are
+    hashed by path alone.
+
+    Args:
+        file_paths: Paths to the files
+    """
+    digest = hashlib.blake2b()
+    for file_path in sorted({os.path.abspath(file_path) for file_path in file_paths}):
+        for part in (file_path, file_digest(file_path) or ""):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load(tool: str, key: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached result for a key, or None on a miss.
+
+    Args:
+        tool: Executable name of the analysis tool
+        key: Cache key from cache_key()
+    """
+    if key is None:
+        return None
+
+    result = _memory.get((tool, key))
+    if result is not None:
+        return result
+
+    try:
+        with open(CACHE_DIR / tool / f"{key}.json", "rb") as f:
+            loaded: Dict[str, Any] = json_backend.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    _memory[(tool, key)] = loaded
+    return loaded
+
+
+def save(tool: str, key: Optional[str], result: Dict[str, Any]) -> None:
+    """
+    Store a result under a key. Failed runs are never cached.
+
+    Args:
+        tool: Executable name of the analysis tool
+        key: Cache key from cache_key()
+        result: Parsed findings to store
+    """
+    if key is None or "error" in result:
+        return
+
+    _memory[(tool, key)] = result
+
+    import tempfile
+
+    tool_dir = CACHE_DIR / tool
+    try:
+        tool_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=tool_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_backend.dumps(result))
+            os.replace(tmp_path, tool_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # A cache that cannot be written is not an audit failure
+        pass
@@ -3,13 +3,118 @@
 import os
 import sys
 import click
-from typing import Dict, Tuple, Any
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple, Any, Optional
 
-from .file_discovery import find_sol_files
-from .slither_runner import run_slither
-from .solhint_runner import run_solhint
+from . import cache, process
+from .file_discovery import find_sol_files, iter_sol_files
+from .slither_runner import (
+    load_cached_slither, project_digest, run_slither, run_slither_batch, run_slither_in_project
+)
+from .solhint_runner import run_solhint_parallel
 from .report_generator import generate_report
-from .ai_assistant import generate_ai_summary
+
+
+# Progress lines buffered between writes when stdout is not a terminal
+PROGRESS_FLUSH_LINES = 32
+
+
+def _announce_scan(sol_files: List[str], quiet: bool) -> None:
+    """
+    Report how many files will be scanned, exiting if there are none.
+    
+    Args:
+        sol_files: Discovered Solidity files
+        quiet: Whether to suppress progress output
+    """
+    if not sol_files:
+        click.echo("No .sol files found.", err=True)
+        sys.exit(1)
+
+    if not quiet:
+        click.echo(f"Scanning {len(sol_files)} files...")
+
+
+def _run_slither_file(file_path: str, project: Optional[str]) -> Dict[str, Any]:
+    """
+    Analyze one file with Slither on its own.
+    
+    Args:
+        file_path: Path to the Solidity file
+        project: Digest from project_digest() when the file is part of a
+            project audit, None for a single-file audit
+    """
+    if project is None:
+        return run_slither(file_path)
+    return run_slither_in_project(file_path, project)
+
+
+def _check_vulnerabilities(path: str, sol_files: List[str], jobs: Optional[int], quiet: bool) -> int:
+    """
+    Run only Slither and stop at the first file with vulnerabilities.
+    
+    Args:
+        path: Path given on the command line
+        sol_files: Solidity files to check
+        jobs: Maximum number of parallel Slither runs, or None for the CPU count
+        quiet: Whether to suppress progress output
+        
+    Returns:
+        Exit code: 1 if a vulnerability was found, 0 otherwise
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    def found_vulnerabilities(file_path: str, result: Dict[str, Any]) -> bool:
+        if not quiet and "error" in result:
+            click.echo(f"    Errors in {os.path.basename(file_path)}")
+        if result.get("vulnerabilities"):
+            if not quiet:
+                click.echo(f"Vulnerabilities found in {file_path}")
+            return True
+        return False
+    
+    # Directories are analyzed as one project, single files on their own
+    project = project_digest(sol_files) if os.path.isdir(path) else None
+    
+    pending = []
+    for file_path in sol_files:
+        cached_result = load_cached_slither(file_path, project)
+        if cached_result is None:
+            pending.append(file_path)
+        elif found_vulnerabilities(file_path, cached_result):
+            return 1
+    
+    if project is not None and pending:
+        batch_results = run_slither_batch(path, pending, project)
+        if "error" in batch_results:
+            if not quiet:
+                click.echo("  Project-wide Slither run failed, analyzing files individually")
+            batch_results = {}
+        for file_path, result in batch_results.items():
+            if found_vulnerabilities(file_path, result):
+                return 1
+        # Files the project run did not cover are analyzed on their own
+        pending = [file_path for file_path in pending if file_path not in batch_results]
+    
+    if pending:
+        executor = ThreadPoolExecutor(max_workers=min(len(pending), jobs or os.cpu_count() or 1))
+        futures = {executor.submit(_run_slither_file, file_path, project): file_path for file_path in pending}
+        try:
+            for future in as_completed(futures):
+                if found_vulnerabilities(futures[future], future.result()):
+                    return 1
+        finally:
+            # Once the outcome is known, analyses that have not started are
+            # dropped and running Slither processes are killed, so exiting does
+            # not wait for them
+            for future in futures:
+                future.cancel()
+            process.shutdown()
+            executor.shutdown()
+    
+    if not quiet:
+        click.echo("No vulnerabilities found.")
+    return 0
 
 
 @click.group()
@@ -58,7 +163,25 @@ def cli():
     default=None,
     help='OpenAI API key (otherwise uses OPENAI_API_KEY env var)'
 )
-def audit(path: str, recursive: bool, output: str, quiet: bool, include_libs: bool, ai: bool, model: str, api_key: str):
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    default=False,
+    help='Re-run Slither and Solhint even for files whose results are cached'
+)
+@click.option(
+    '--jobs', '-j',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of analyses to run in parallel (default: CPU count)'
+)
+@click.option(
+    '--check',
+    is_flag=True,
+    default=False,
+    help='Only run Slither and exit with status 1 at the first vulnerability, without a report'
+)
+def audit(path: str, recursive: bool, output: str, quiet: bool, include_libs: bool, ai: bool, model: str, api_key: str, no_cache: bool, jobs: Optional[int], check: bool):
     """
     Run offline audit on path (file/dir/project).
     
@@ -67,37 +190,144 @@ def audit(path: str, recursive: bool, output: str, quiet: bool, include_libs: bo
     By default, library folders (lib/, node_modules/) are excluded.
     Use --include-libs to scan these folders.
     """
-    sol_files = find_sol_files(path, recursive, include_libs=include_libs)
+    # Imported here so --help and --version stay fast
+    import queue
+    import threading
+    from concurrent.futures import Future, ThreadPoolExecutor, as_completed
     
-    if not sol_files:
-        click.echo("No .sol files found.", err=True)
-        sys.exit(1)
-
-    if not quiet:
-        click.echo(f"Scanning {len(sol_files)} files...")
+    # One timestamp per run so the report name and header agree
+    now = datetime.now()
+    cache.set_enabled(not no_cache)
     
-    all_results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+    if check:
+        check_files = find_sol_files(path, recursive, include_libs=include_libs)
+        _announce_scan(check_files, quiet)
+        sys.exit(_check_vulnerabilities(path, check_files, jobs, quiet))
     
-    for file_path in sol_files:
-        if not quiet:
-            click.echo(f"  - {file_path}")
+    # Walk the tree on a producer thread so files are hashed for the cache
+    # while others are still being found; None marks the end of discovery
+    discovered: "queue.Queue[Optional[str]]" = queue.Queue()
+    discovery_errors: List[BaseException] = []
+    
+    def produce() -> None:
+        try:
+            for file_path in iter_sol_files(path, recursive, include_libs=include_libs):
+                discovered.put(file_path)
+        except BaseException as e:
+            discovery_errors.append(e)
+        finally:
+            discovered.put(None)
+    
+    threading.Thread(target=produce, daemon=True).start()
+    
+    sol_files: List[str] = []
+    tool_results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    
+    # Directories are analyzed as one project, single files on their own
+    is_project = os.path.isdir(path)
+    
+    for file_path in iter(discovered.get, None):
+        sol_files.append(file_path)
+        tool_results[file_path] = {}
+        if is_project and cache.is_enabled():
+            # Project results are keyed on every file of the project
+            cache.file_digest(file_path)
+    
+    if discovery_errors:
+        raise discovery_errors[0]
+    _announce_scan(sol_files, quiet)
+    
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as executor:
+        # Both tools spend their time in external processes, so Solhint runs
+        # alongside the project-wide Slither run and any per-file runs, and
+        # results are collected as they finish
+        # Each future maps to the file it analyzes, or None when it covers
+        # every file, and the tool that produced it
+        futures: Dict[Future, Tuple[Optional[str], str]] = {
+            executor.submit(run_solhint_parallel, sol_files, jobs): (None, "solhint")
+        }
         
-        slither_results = run_slither(file_path)
-        solhint_results = run_solhint(file_path)
+        # Reuse Slither results when none of the files they depend on changed
+        project = project_digest(sol_files) if is_project else None
+        pending: List[str] = []
+        for file_path in sol_files:
+            cached_result = load_cached_slither(file_path, project)
+            if cached_result is None:
+                pending.append(file_path)
+            else:
+                tool_results[file_path]["slither"] = cached_result
         
-        all_results[file_path] = (slither_results, solhint_results)
+        # Compile projects once instead of once per file
+        if project is not None and pending:
+            batch_results = run_slither_batch(path, pending, project)
+            if "error" in batch_results:
+                if not quiet:
+                    click.echo("  Project-wide Slither run failed, analyzing files individually")
+            else:
+                for file_path, result in batch_results.items():
+                    tool_results[file_path]["slither"] = result
         
-        if "error" in slither_results or "error" in solhint_results:
-            if not quiet:
-                click.echo(f"    Errors in {os.path.basename(file_path)}")
+        # Files the project run did not cover are analyzed on their own
+        for file_path in pending:
+            if "slither" not in tool_results[file_path]:
+                futures[executor.submit(_run_slither_file, file_path, project)] = (file_path, "slither")
+        
+        # On a terminal every line is echoed as soon as its file is done;
+        # redirected output is written in batches to skip click.echo's
+        # per-call terminal handling
+        is_tty = sys.stdout.isatty()
+        progress: List[str] = []
+        
+        def flush_progress() -> None:
+            if progress:
+                sys.stdout.write("".join(progress))
+                sys.stdout.flush()
+                progress.clear()
+        
+        # Progress is only emitted from this thread, so lines never interleave
+        for future in as_completed(futures):
+            target, tool = futures[future]
+            if target is None:
+                finished: Iterable[Tuple[str, Dict[str, Any]]] = future.result().items()
+            else:
+                finished = [(target, future.result())]
+            
+            for file_path, result in finished:
+                done = tool_results[file_path]
+                done[tool] = result
+                if len(done) < 2 or quiet:
+                    continue
+                
+                lines = [f"  - {file_path}"]
+                if "error" in done["slither"] or "error" in done["solhint"]:
+                    lines.append(f"    Errors in {os.path.basename(file_path)}")
+                
+                if is_tty:
+                    for line in lines:
+                        click.echo(line)
+                else:
+                    progress.extend(line + "\n" for line in lines)
+                    if len(progress) >= PROGRESS_FLUSH_LINES:
+                        flush_progress()
+        
+        flush_progress()
+    
+    # Keep the report in discovery order regardless of completion order
+    all_results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {
+        f: (tool_results[f]["slither"], tool_results[f]["solhint"]) for f in sol_files
+    }
 
     ai_summary_text = None
     if ai:
         if not quiet:
             click.echo("\nContacting OpenAI for AI summary...")
-        ai_summary_text = generate_ai_summary(all_results, sol_files, model=model, api_key=api_key)
+        import asyncio
+        from .ai_assistant import generate_ai_summary_async
+        ai_summary_text = asyncio.run(
+            generate_ai_summary_async(all_results, sol_files, model=model, api_key=api_key)
+        )
 
-    summary = generate_report(all_results, sol_files, output_file=output, ai_summary=ai_summary_text)
+    summary = generate_report(all_results, sol_files, output_file=output, ai_summary=ai_summary_text, now=now)
 
     if not quiet:
         click.echo("\nAudit Summary:")
@@ -105,6 +335,8 @@ def audit(path: str, recursive: bool, output: str, quiet: bool, include_libs: bo
         click.echo(f"- Vulnerabilities: {summary['vulnerabilities']}")
         click.echo(f"- Inefficiencies: {summary['inefficiencies']}")
         click.echo(f"- Best Practices: {summary['best_practices']}")
+        if summary['duplicates_suppressed']:
+            click.echo(f"- Duplicates Suppressed: {summary['duplicates_suppressed']}")
         click.echo(f"- Report saved to: {summary['report_file']}")
         if ai:
             click.echo("- AI summary included in report")
@@ -2,11 +2,11 @@
 
 import os
 import glob
-from typing import List, Set
+from typing import FrozenSet, Iterator, List, Tuple
 
 
 # Default folders to exclude (library and build artifacts)
-DEFAULT_EXCLUDE_DIRS = {
+DEFAULT_EXCLUDE_DIRS = frozenset({
     'lib',           # Foundry dependencies
     'node_modules',  # Hardhat/NPM dependencies
     '.git',          # Version control
@@ -14,91 +14,184 @@ DEFAULT_EXCLUDE_DIRS = {
     'out',           # Build output (Hardhat)
     'artifacts',    # Build artifacts (Hardhat)
     '.cache',        # Cache directories
-}
+})
 
+# Number of top-level subdirectories from which discovery walks them in parallel
+PARALLEL_WALK_MIN_SUBDIRS = 4
 
-def _should_exclude_path(root: str, exclude_dirs: Set[str]) -> bool:
+
+def _scan_dir(path: str, exclude_dirs: FrozenSet[str]) -> Tuple[List[str], List[str]]:
     """
-    Check if a directory path should be excluded.
+    List the .sol files and subdirectories to visit in one directory.
+    
+    Directory entries carry their type from the directory listing, so files
+    are classified without a stat call per entry. Excluded directories are
+    pruned here, before they are opened.
     
     Args:
-        root: Directory path to check
-        exclude_dirs: Set of directory names to exclude
+        path: Directory to list
+        exclude_dirs: Set of directory names not to descend into
         
     Returns:
-        True if path should be excluded, False otherwise
+        Tuple of (.sol file paths, subdirectory paths), both in listing order
     """
-    # Split path into components
-    path_parts = os.path.normpath(root).split(os.sep)
+    sol_files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # Like os.walk, do not descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude_dirs:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.sol') and entry.is_file():
+                    sol_files.append(entry.path)
+    except OSError:
+        pass
+    return sol_files, subdirs
+
+
+def _iter_sol(root: str, exclude_dirs: FrozenSet[str]) -> Iterator[str]:
+    """
+    Yield .sol files under root with a stack-based os.scandir traversal.
     
-    # Check if any component matches an excluded directory
-    for part in path_parts:
-        if part in exclude_dirs:
-            return True
+    Visit order matches a top-down os.walk.
     
-    return False
+    Args:
+        root: Directory to search
+        exclude_dirs: Set of directory names not to descend into
+        
+    Yields:
+        .sol file paths
+    """
+    stack = [root]
+    
+    while stack:
+        sol_files, subdirs = _scan_dir(stack.pop(), exclude_dirs)
+        yield from sol_files
+        
+        # Reverse so subdirectories are popped in listing order
+        stack.extend(reversed(subdirs))
 
 
-def find_sol_files(
-    path: str,
-    recursive: bool = True,
-    include_libs: bool = False
-) -> List[str]:
+def _walk_sol_files(root: str, exclude_dirs: FrozenSet[str]) -> Iterator[str]:
     """
-    Find all .sol files in path (file, dir, or project).
+    Yield .sol files under root, walking top-level subdirectories in parallel.
+    
+    Directory listing is I/O bound, so threads overlap the filesystem latency
+    of separate subtrees. Shallow trees are walked on the calling thread.
+    Files are yielded in the same order as a sequential walk, each subtree as
+    soon as it and the subtrees before it have been walked.
+    
+    Args:
+        root: Directory to search
+        exclude_dirs: Set of directory names not to descend into
+        
+    Yields:
+        .sol file paths
+    """
+    sol_files, subdirs = _scan_dir(root, exclude_dirs)
+    yield from sol_files
+    
+    if len(subdirs) < PARALLEL_WALK_MIN_SUBDIRS:
+        for subdir in subdirs:
+            yield from _iter_sol(subdir, exclude_dirs)
+        return
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=min(len(subdirs), os.cpu_count() or 1)) as executor:
+        for subtree in executor.map(lambda subdir: list(_iter_sol(subdir, exclude_dirs)), subdirs):
+            yield from subtree
+
+
+def _discover(path: str, recursive: bool, include_libs: bool) -> Iterator[str]:
+    """
+    Yield .sol files in path.
     
     Args:
         path: File path, directory path, or project root
         recursive: Whether to search recursively in directories
-        include_libs: If True, include library folders (lib/, node_modules/)
-                     If False, exclude them by default
+        include_libs: Whether to include library folders (lib/, node_modules/)
         
-    Returns:
-        List of .sol file paths
+    Yields:
+        .sol file paths
     """
-    sol_files = []
-    
     # Determine which directories to exclude
-    exclude_dirs = set() if include_libs else DEFAULT_EXCLUDE_DIRS
+    exclude_dirs: FrozenSet[str] = frozenset() if include_libs else DEFAULT_EXCLUDE_DIRS
     
     if os.path.isfile(path) and path.endswith('.sol'):
-        sol_files = [path]
+        yield path
     elif os.path.isdir(path):
         if recursive:
-            for root, dirs, files in os.walk(path):
-                # Prune excluded directories from os.walk
-                if not include_libs:
-                    dirs[:] = [d for d in dirs if d not in exclude_dirs]
-                
-                # Skip this directory if it should be excluded
-                if _should_exclude_path(root, exclude_dirs):
-                    continue
-                
-                for file in files:
-                    if file.endswith('.sol'):
-                        sol_files.append(os.path.join(root, file))
+            yield from _walk_sol_files(path, exclude_dirs)
         else:
-            sol_files = glob.glob(os.path.join(path, '*.sol'))
+            yield from glob.glob(os.path.join(path, '*.sol'))
     else:
-        # Assume current dir project scan
+        # Assume current dir project scan; one listing finds the project
+        # folders and the loose .sol files used as a fallback
         project_dirs = ['src', 'contracts']
+        found_dirs = set()
+        root_sol_files = []
+        try:
+            with os.scandir('.') as entries:
+                for entry in entries:
+                    if entry.name in project_dirs and entry.is_dir():
+                        found_dirs.add(entry.name)
+                    elif entry.name.endswith('.sol') and not entry.name.startswith('.'):
+                        root_sol_files.append(entry.name)
+        except OSError:
+            pass
+        
+        found = False
         for dir_name in project_dirs:
-            if os.path.exists(dir_name):
-                for root, dirs, files in os.walk(dir_name):
-                    # Prune excluded directories from os.walk
-                    if not include_libs:
-                        dirs[:] = [d for d in dirs if d not in exclude_dirs]
-                    
-                    # Skip this directory if it should be excluded
-                    if _should_exclude_path(root, exclude_dirs):
-                        continue
-                    
-                    for file in files:
-                        if file.endswith('.sol'):
-                            sol_files.append(os.path.join(root, file))
-        if not sol_files:
+            if dir_name in found_dirs:
+                for file_path in _walk_sol_files(dir_name, exclude_dirs):
+                    found = True
+                    yield file_path
+        if not found:
             # Fallback: all .sol in current dir
-            sol_files = glob.glob('*.sol')
+            yield from root_sol_files
+
+
+def iter_sol_files(
+    path: str,
+    recursive: bool = True,
+    include_libs: bool = False
+) -> Iterator[str]:
+    """
+    Yield .sol files in path as they are found.
     
-    return sol_files if sol_files else []
+    Same files and order as find_sol_files, but produced lazily so callers
+    can start work before the whole tree has been walked.
+    
+    Args:
+        path: File path, directory path, or project root
+        recursive: Whether to search recursively in directories
+        include_libs: If True, include library folders (lib/, node_modules/)
+                     If False, exclude them by default
+        
+    Yields:
+        .sol file paths
+    """
+    return _discover(path, recursive, include_libs)
 
+
+def find_sol_files(
+    path: str,
+    recursive: bool = True,
+    include_libs: bool = False
+) -> List[str]:
+    """
+    Find all .sol files in path (file, dir, or project).
+    
+    Args:
+        path: File path, directory path, or project root
+        recursive: Whether to search recursively in directories
+        include_libs: If True, include library folders (lib/, node_modules/)
+                     If False, exclude them by default
+        
+    Returns:
+        List of .sol file paths
+    """
+    return list(_discover(path, recursive, include_libs))
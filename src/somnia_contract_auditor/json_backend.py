@@ -0,0 +1,44 @@
+"""JSON (de)serialization, using orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    orjson parses raw bytes without an intermediate str, and is several times
+    faster than the standard library on large tool outputs. Both backends raise
+    json.JSONDecodeError (orjson's error is a subclass) on invalid input.
+    
+    Args:
+        data: JSON document as bytes or str
+        
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation instead of compact output
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
@@ -0,0 +1,196 @@
+"""Helpers for running external tools and streaming their output."""
+
+import subprocess
+import threading
+from typing import IO, Any, Callable, List, NamedTuple, Optional, Sequence, Set, Tuple, Type, cast
+
+
+# Buffer size for the stdout pipe, so large JSON outputs are read in few syscalls
+PIPE_BUFFER_SIZE = 1 << 20
+
+# Number of leading stdout bytes kept for error reporting
+STDOUT_HEAD_LIMIT = 64 * 1024
+
+
+# Commands started through this module that have not been reaped yet
+_running: Set[subprocess.Popen] = set()
+_running_lock = threading.Lock()
+_shut_down = False
+
+
+class StreamResult(NamedTuple):
+    """Outcome of a command whose stdout was parsed while it ran."""
+
+    value: Any
+    parse_failed: bool
+    returncode: int
+    stdout_head: str
+    stderr: str
+
+
+class _StreamHead:
+    """File-like wrapper that remembers the first bytes read from a stream."""
+
+    def __init__(self, stream, limit: int = STDOUT_HEAD_LIMIT):
+        self._stream = stream
+        self._limit = limit
+        self.head = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk: bytes = self._stream.read(size)
+        if len(self.head) < self._limit:
+            self.head += chunk[:self._limit - len(self.head)]
+        return chunk
+
+
+def _start(cmd: Sequence[str], **kwargs: Any) -> subprocess.Popen:
+    """Start a command and track it until _finish() is called for it."""
+    with _running_lock:
+        if _shut_down:
+            raise RuntimeError("cannot start commands after shutdown")
+        proc = subprocess.Popen(cmd, **kwargs)
+        _running.add(proc)
+    return proc
+
+
+def _finish(proc: subprocess.Popen) -> None:
+    """Stop tracking a command that has been waited for."""
+    with _running_lock:
+        _running.discard(proc)
+
+
+def shutdown() -> None:
+    """
+    Kill every running command and refuse to start new ones.
+
+    Meant for exiting early while analyses are still running on other
+    threads: their commands end at once, so those threads finish instead of
+    keeping the interpreter alive until each tool completes.
+    """
+    global _shut_down
+    with _running_lock:
+        _shut_down = True
+        for proc in _running:
+            proc.kill()
+
+
+def run_quiet(cmd: Sequence[str], timeout: Optional[float] = None) -> int:
+    """
+    Run a command with its output discarded and return its exit code.
+
+    Args:
+        cmd: Command and arguments to run
+        timeout: Seconds before the command is killed, or None for no limit
+
+    Returns:
+        Exit code of the command
+
+    Raises:
+        FileNotFoundError: If the executable cannot be found
+        subprocess.TimeoutExpired: If the command runs longer than timeout
+    """
+    proc = _start(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        return proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        _finish(proc)
+
+
+def run_streaming(
+    cmd: Sequence[str],
+    parse: Callable[[Any], Any],
+    parse_errors: Tuple[Type[BaseException], ...] = (ValueError,),
+    timeout: Optional[float] = None,
+    cwd: Optional[str] = None
+) -> StreamResult:
+    """
+    Run a command and parse its stdout straight from the pipe while it runs.
+
+    The output is never buffered as a whole, so parsing overlaps with the tool
+    writing it. Only the first STDOUT_HEAD_LIMIT bytes are kept for error
+    messages. Stderr is drained on a helper thread so the child cannot block
+    on a full pipe.
+
+    Args:
+        cmd: Command and arguments to run
+        parse: Callable receiving a binary file-like object for stdout
+        parse_errors: Exception types from parse that mark the output unparseable
+        timeout: Seconds before the command is killed, or None for no limit
+        cwd: Working directory for the command
+
+    Returns:
+        StreamResult with the parsed value (None if parsing failed), exit code,
+        the head of stdout and all of stderr
+
+    Raises:
+        FileNotFoundError: If the executable cannot be found
+        subprocess.TimeoutExpired: If the command runs longer than timeout
+        RuntimeError: If shutdown() has been called
+    """
+    proc = _start(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=PIPE_BUFFER_SIZE,
+        cwd=cwd
+    )
+
+    # Both pipes were requested above, so neither is None
+    proc_stdout = cast(IO[bytes], proc.stdout)
+    proc_stderr = cast(IO[bytes], proc.stderr)
+
+    stderr_chunks: List[bytes] = []
+    drain = threading.Thread(target=lambda: stderr_chunks.append(proc_stderr.read()), daemon=True)
+    drain.start()
+
+    timed_out = threading.Event()
+    timer = None
+    if timeout is not None:
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+
+    stdout = _StreamHead(proc_stdout)
+    value = None
+    parse_failed = False
+    try:
+        try:
+            value = parse(stdout)
+        except parse_errors:
+            parse_failed = True
+        except BaseException:
+            # The rest of the output will never be read, so stop the command
+            # instead of leaving it blocked on a pipe nobody drains
+            proc.kill()
+            proc.wait()
+            raise
+
+        # Discard anything left unread so the command can exit
+        for _ in iter(lambda: proc_stdout.read(65536), b""):
+            pass
+        proc.wait()
+        drain.join()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        proc_stdout.close()
+        proc_stderr.close()
+        _finish(proc)
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout or 0)
+
+    return StreamResult(
+        value=value,
+        parse_failed=parse_failed,
+        returncode=proc.returncode,
+        stdout_head=bytes(stdout.head).decode("utf-8", errors="replace"),
+        stderr=b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    )
@@ -2,14 +2,57 @@
 
 import os
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Sequence, Set, Tuple, Any, Optional
+
+
+def _format_findings(entries: List[Dict[str, Any]]) -> str:
+    """
+    Format findings as Markdown list items, one per line.
+    
+    Args:
+        entries: Findings with severity, issue and location keys
+        
+    Returns:
+        Joined Markdown lines
+    """
+    parts: List[str] = []
+    for issue in entries:
+        parts.append(f"- **{issue['severity']}**: {issue['issue']} at {issue['location']}\n")
+    return "".join(parts)
+
+
+def _unique_findings(
+    entries: Sequence[Dict[str, Any]],
+    seen: Set[Tuple[Any, Any, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Drop findings already written elsewhere in the report.
+    
+    Shared libraries imported by many contracts make Slither report the same
+    issue at the same location once per compilation unit.
+    
+    Args:
+        entries: Findings with severity, issue and location keys
+        seen: (issue, location, severity) keys written so far, updated in place
+        
+    Returns:
+        Findings not seen before, in their original order
+    """
+    unique: List[Dict[str, Any]] = []
+    for issue in entries:
+        key = (issue["issue"], issue["location"], issue["severity"])
+        if key not in seen:
+            seen.add(key)
+            unique.append(issue)
+    return unique
 
 
 def generate_report(
     all_results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]],
     sol_files: List[str],
-    output_file: str = None,
-    ai_summary: str = None
+    output_file: Optional[str] = None,
+    ai_summary: Optional[str] = None,
+    now: Optional[datetime] = None
 ) -> Dict[str, Any]:
     """
     Generate Markdown report and return summary.
@@ -18,91 +61,115 @@ def generate_report(
         all_results: Dictionary mapping file paths to (slither_results, solhint_results)
         sol_files: List of scanned Solidity files
         output_file: Optional custom output file path
+        ai_summary: Optional AI summary placed at the top of the report
+        now: Time the audit ran, shared by the file name and the header
         
     Returns:
         Dictionary containing summary statistics and report file path
     """
+    if now is None:
+        now = datetime.now()
     if output_file is None:
-        output_file = f"audit-report-{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        output_file = f"audit-report-{now.strftime('%Y%m%d_%H%M%S')}.md"
     
-    with open(output_file, "w") as f:
-        f.write(f"# Audit Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"**Files Scanned**: {len(sol_files)} ({', '.join(sol_files)})\n\n")
-        f.write(f"**Mode**: Offline (Slither, Solhint)\n\n")
+    # Collect the report in memory and write it with a single call
+    parts: List[str] = []
+    parts.append(f"# Audit Report - {now.isoformat(sep=' ', timespec='seconds')}\n\n")
+    parts.append(f"**Files Scanned**: {len(sol_files)} ({', '.join(sol_files)})\n\n")
+    parts.append(f"**Mode**: Offline (Slither, Solhint)\n\n")
 
-        # Optional AI summary section at top for quick insights
-        if ai_summary:
-            f.write("## AI Summary & Recommended Fixes\n")
-            f.write(ai_summary)
-            if not ai_summary.endswith("\n"):
-                f.write("\n")
-            f.write("\n")
+    # Optional AI summary section at top for quick insights
+    if ai_summary:
+        parts.append("## AI Summary & Recommended Fixes\n")
+        parts.append(ai_summary)
+        if not ai_summary.endswith("\n"):
+            parts.append("\n")
+        parts.append("\n")
 
-        # Per-file results
-        for file_path, (slither_results, solhint_results) in all_results.items():
-            f.write(f"## {os.path.basename(file_path)}\n")
-            
-            # Slither results
-            if "error" in slither_results:
-                f.write(f"### Slither Error\n")
-                f.write(f"```\n{slither_results['error']}\n```\n\n")
-            elif "warning" in slither_results:
-                f.write(f"### Slither Warning\n")
-                f.write(f"⚠️ {slither_results['warning']}\n\n")
-                
-            if "error" not in slither_results:
-                for category in ["vulnerabilities", "inefficiencies", "best_practices"]:
-                    issues = slither_results.get(category, [])
-                    if issues:
-                        f.write(f"### {category.capitalize()}\n")
-                        for issue in issues:
-                            f.write(
-                                f"- **{issue['severity']}**: "
-                                f"{issue['issue']} at {issue['location']}\n"
-                            )
-                        f.write("\n")
+    # Per-file results, writing each distinct finding only once
+    seen: Set[Tuple[Any, Any, Any]] = set()
+    duplicates_suppressed = 0
+    total_vulns = total_ineff = total_bp = 0
+    for file_path, (slither_results, solhint_results) in all_results.items():
+        # Look up each result field once
+        slither_error = slither_results.get("error")
+        slither_warning = slither_results.get("warning")
+        vulns = slither_results.get("vulnerabilities", ())
+        ineffs = slither_results.get("inefficiencies", ())
+        slither_bps = slither_results.get("best_practices", ())
+        solhint_error = solhint_results.get("error")
+        solhint_bps = solhint_results.get("best_practices", ())
+        
+        total_vulns += len(vulns)
+        total_ineff += len(ineffs)
+        total_bp += len(slither_bps) + len(solhint_bps)
+        
+        basename = os.path.basename(file_path)
+        parts.append(f"## {basename}\n")
+        
+        # Slither results
+        if slither_error is not None:
+            parts.append(f"### Slither Error\n")
+            parts.append(f"```\n{slither_error}\n```\n\n")
+        else:
+            if slither_warning is not None:
+                parts.append(f"### Slither Warning\n")
+                parts.append(f"⚠️ {slither_warning}\n\n")
             
-            # Solhint results
-            if "error" in solhint_results:
-                f.write(f"### Solhint Error\n")
-                f.write(f"{solhint_results['error']}\n\n")
-            else:
-                issues = solhint_results.get("best_practices", [])
+            for heading, all_issues in (
+                ("Vulnerabilities", vulns),
+                ("Inefficiencies", ineffs),
+                ("Best_practices", slither_bps)
+            ):
+                issues = _unique_findings(all_issues, seen)
+                duplicates_suppressed += len(all_issues) - len(issues)
                 if issues:
-                    f.write(f"### Best Practices (Solhint)\n")
-                    for issue in issues:
-                        f.write(
-                            f"- **{issue['severity']}**: "
-                            f"{issue['issue']} at {issue['location']}\n"
-                        )
-                    f.write("\n")
-            
-            f.write("\n")
-
-        # Summary
-        total_vulns = sum(
-            len(r[0].get("vulnerabilities", [])) for r in all_results.values()
-        )
-        total_ineff = sum(
-            len(r[0].get("inefficiencies", [])) for r in all_results.values()
-        )
-        total_bp = sum(
-            len(r[0].get("best_practices", [])) + len(r[1].get("best_practices", []))
-            for r in all_results.values()
-        )
-        total_issues = total_vulns + total_ineff + total_bp
+                    parts.append(f"### {heading}\n")
+                    parts.append(_format_findings(issues))
+                    parts.append("\n")
+        
+        # Solhint results
+        if solhint_error is not None:
+            parts.append(f"### Solhint Error\n")
+            parts.append(f"{solhint_error}\n\n")
+        else:
+            issues = _unique_findings(solhint_bps, seen)
+            duplicates_suppressed += len(solhint_bps) - len(issues)
+            if issues:
+                parts.append(f"### Best Practices (Solhint)\n")
+                parts.append(_format_findings(issues))
+                parts.append("\n")
         
-        f.write("## Summary\n")
-        f.write(f"- Total Issues: {total_issues}\n")
-        f.write(f"- Vulnerabilities: {total_vulns}\n")
-        f.write(f"- Inefficiencies: {total_ineff}\n")
-        f.write(f"- Best Practices: {total_bp}\n")
+        parts.append("\n")
+
+    # Summary
+    total_issues = total_vulns + total_ineff + total_bp
+    
+    parts.append("## Summary\n")
+    parts.append(f"- Total Issues: {total_issues}\n")
+    parts.append(f"- Vulnerabilities: {total_vulns}\n")
+    parts.append(f"- Inefficiencies: {total_ineff}\n")
+    parts.append(f"- Best Practices: {total_bp}\n")
+    parts.append(f"- Duplicates Suppressed: {duplicates_suppressed}\n")
+
+    # Encode once and write the raw bytes, skipping the text I/O layer.
+    # Track an offset instead of slicing a memoryview: mypy treats memoryview
+    # as bytes, and the mypyc build then miscompiles the slice
+    data = "".join(parts).encode("utf-8")
+    fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
 
     return {
         "total_issues": total_issues,
         "vulnerabilities": total_vulns,
         "inefficiencies": total_ineff,
         "best_practices": total_bp,
+        "duplicates_suppressed": duplicates_suppressed,
         "report_file": output_file
     }
 
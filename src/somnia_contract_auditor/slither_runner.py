@@ -1,8 +1,53 @@
 """Slither analysis runner module."""
 
+import functools
 import json
+import os
+import re
 import subprocess
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple, Type, cast
+
+from . import cache, json_backend, process
+
+try:
+    import ijson
+    _JSON_ERRORS: Tuple[Type[BaseException], ...] = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (ValueError,)
+
+try:
+    # Compiled by setup.py when Cython is available
+    from ._classify import classify as _classify_compiled
+except ImportError:
+    _classify_compiled = None
+
+
+# Seconds Slither may run before it is killed
+SLITHER_TIMEOUT = 300
+
+# Cache key material for results of single-file and project-wide runs
+_FILE_MODE = b"file"
+_PROJECT_MODE = b"project"
+
+# Import directives; the path is the first quoted string after "import"
+_IMPORT_RE = re.compile(rb"""\bimport\b[^;"']*["']([^"']+)["']""")
+
+# Source mapping fields used when building finding locations
+_SOURCE_MAPPING_FIELDS = ("filename_short", "filename_absolute", "lines")
+
+# Category keywords, matched anywhere in a description; vulnerability keywords win
+_VULN_RE = re.compile(r"reentrancy|vulnerability", re.IGNORECASE)
+_INEFF_RE = re.compile(r"gas|optimization", re.IGNORECASE)
+
+# Error text patterns and the message added for them, tried in order; a
+# message of None quotes the compiler's error lines instead
+_SLITHER_ERROR_PATTERNS = (
+    (("Compilation error", "ParserError"), None),
+    (("No contracts were found",), "No contracts found in the file"),
+    (("FileNotFoundError", "No such file"), "File not found or cannot be read"),
+    (("Import error", "ImportError"), "Import/dependency error - missing library or incorrect path"),
+)
 
 
 def _parse_slither_error(stderr: str, stdout: str, returncode: int) -> str:
@@ -22,157 +67,383 @@ def _parse_slither_error(stderr: str, stdout: str, returncode: int) -> str:
     # Try to extract meaningful error from stderr or stdout
     error_text = stderr or stdout or ""
     
-    # Common error patterns
-    if "Compilation error" in error_text or "ParserError" in error_text:
-        # Extract compilation errors
-        lines = error_text.split('\n')
-        error_lines = [line for line in lines if 'Error' in line or 'error' in line.lower()]
-        if error_lines:
-            error_msg += f"\nCompilation Error: {error_lines[0]}"
-            # Include first few error lines
-            if len(error_lines) > 1:
-                error_msg += "\n" + "\n".join(error_lines[1:3])
-    elif "No contracts were found" in error_text:
-        error_msg += "\nNo contracts found in the file"
-    elif "FileNotFoundError" in error_text or "No such file" in error_text:
-        error_msg += "\nFile not found or cannot be read"
-    elif "Import error" in error_text or "ImportError" in error_text:
-        error_msg += "\nImport/dependency error - missing library or incorrect path"
-    elif "Solc" in error_text or "solc" in error_text.lower():
+    lowered = error_text.lower()
+    
+    # Common error patterns, first match wins
+    for needles, message in _SLITHER_ERROR_PATTERNS:
+        if not any(needle in error_text for needle in needles):
+            continue
+        
+        if message is None:
+            # Extract compilation errors
+            error_lines = [
+                line
+                for line, lower_line in zip(error_text.splitlines(), lowered.splitlines())
+                if "error" in lower_line
+            ]
+            if error_lines:
+                error_msg += f"\nCompilation Error: {error_lines[0]}"
+                # Include first few error lines
+                if len(error_lines) > 1:
+                    error_msg += "\n" + "\n".join(error_lines[1:3])
+        else:
+            error_msg += f"\n{message}"
+        return error_msg
+    
+    if "solc" in lowered:
         error_msg += "\nSolidity compiler issue - check compiler version"
     elif stderr:
         # Use first few lines of stderr if available
-        stderr_lines = stderr.strip().split('\n')[:3]
+        stderr_lines = stderr.strip().splitlines()[:3] or [""]
         error_msg += f"\n{stderr_lines[0]}"
         if len(stderr_lines) > 1:
             error_msg += "\n" + "\n".join(stderr_lines[1:])
     elif stdout:
         # Sometimes errors go to stdout
-        stdout_lines = stdout.strip().split('\n')[:3]
+        stdout_lines = stdout.strip().splitlines()[:1] or [""]
         error_msg += f"\n{stdout_lines[0]}"
     
     return error_msg
 
 
-def run_slither(file_path: str) -> Dict[str, Any]:
+def _empty_findings() -> Dict[str, List[Dict[str, Any]]]:
+    """Return an empty findings structure."""
+    return {
+        "vulnerabilities": [],
+        "inefficiencies": [],
+        "best_practices": []
+    }
+
+
+def _slim_detector(detector: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the detector fields used to build findings."""
+    elements = []
+    for element in detector.get("elements", []):
+        source_mapping = element.get("source_mapping", {})
+        elements.append({
+            "source_mapping": {
+                key: source_mapping[key] for key in _SOURCE_MAPPING_FIELDS if key in source_mapping
+            }
+        })
+    return {
+        "description": detector.get("description", ""),
+        "impact": detector.get("impact", "Info"),
+        "elements": elements
+    }
+
+
+def _load_detectors(stream) -> List[Dict[str, Any]]:
     """
-    Run Slither using CLI output and return parsed findings.
+    Parse the detector list from Slither's JSON output.
+    
+    With ijson installed, detectors are parsed one at a time straight from the
+    pipe so the full JSON document is never held in memory.
     
     Args:
-        file_path: Path to the Solidity file to analyze
+        stream: Binary file-like object with Slither's JSON output
         
     Returns:
-        Dictionary containing vulnerabilities, inefficiencies, and best practices
+        List of slimmed-down detector dictionaries
     """
+    if ijson is not None:
+        return [
+            _slim_detector(detector)
+            for detector in ijson.items(stream, "results.detectors.item", use_float=True)
+        ]
+    
+    data = json_backend.loads(stream.read())
+    detectors = ((data or {}).get("results") or {}).get("detectors") or []
+    return [_slim_detector(detector) for detector in detectors]
+
+
+def _load_project_output(stream) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Parse the detector list and the compiled sources from Slither's JSON output.
+    
+    Expects output with the detectors and compilations JSON types. With ijson
+    installed the output is parsed in one streaming pass, and the compilation
+    ASTs are skipped over instead of being built.
+    
+    Args:
+        stream: Binary file-like object with Slither's JSON output
+        
+    Returns:
+        Tuple of (slimmed-down detector dictionaries, absolute paths of the
+        source files that were compiled)
+    """
+    detectors: List[Dict[str, Any]] = []
+    compiled: List[str] = []
+    
+    if ijson is not None:
+        builder = None
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if prefix == "results.detectors.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "results.detectors.item" and event == "end_map":
+                    detectors.append(_slim_detector(builder.value))
+                    builder = None
+            elif (
+                event == "string"
+                and prefix.startswith("results.compilations.item.compilation_units.")
+                and prefix.endswith(".filenames.item.absolute")
+            ):
+                compiled.append(value)
+        return detectors, compiled
+    
+    results = (json_backend.loads(stream.read()) or {}).get("results") or {}
+    detectors = [_slim_detector(detector) for detector in results.get("detectors") or []]
+    for compilation in results.get("compilations") or []:
+        for unit in (compilation.get("compilation_units") or {}).values():
+            compiled.extend(filename["absolute"] for filename in unit.get("filenames") or [])
+    return detectors, compiled
+
+
+@functools.lru_cache(maxsize=None)
+def _detector_classes() -> Optional[Tuple[type, ...]]:
+    """
+    Return Slither's built-in detector classes, or None if Slither is not importable.
+    
+    Cached so the detector module scan, and a failed import, happen once per
+    process rather than once per analysis.
+    """
+    import inspect
+    
     try:
-        # Try running Slither with JSON output
-        result = subprocess.run(
-            ["slither", file_path, "--json", "-"],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+        from slither.detectors import all_detectors
+        from slither.detectors.abstract_detector import AbstractDetector
+    except ImportError:
+        return None
+    
+    return tuple(
+        detector_class
+        for detector_class in (getattr(all_detectors, name) for name in dir(all_detectors))
+        if (
+            inspect.isclass(detector_class)
+            and issubclass(detector_class, AbstractDetector)
+            and detector_class is not AbstractDetector
         )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _slither_importable() -> bool:
+    """Return whether the Slither package can be imported, without importing it."""
+    import importlib.util
+    
+    return importlib.util.find_spec("slither") is not None
+
 
-        # Slither exit codes:
-        # 0: Success, no issues found
-        # 255: Success, issues found (this is the default for --json)
-        # 1: Error occurred
-        # Other: Various errors
+def _run_detectors_in_process(target: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Run all Slither detectors in this process through the Slither API.
+    
+    This skips the JSON round trip of the CLI. Runs in a worker process
+    started by _run_project_in_process.
+    
+    Args:
+        target: Path to a Solidity file or project directory
         
-        data = None
+    Returns:
+        Tuple of (slimmed-down detector results, absolute paths of the
+        source files that were compiled)
+    """
+    from slither import Slither
+    
+    slither = Slither(target)
+    for detector_class in _detector_classes() or ():
+        slither.register_detector(detector_class)
+    
+    # One list of result dictionaries (same shape as the CLI JSON) per detector
+    detectors = [
+        _slim_detector(result)
+        for detector_results in slither.run_detectors()
+        for result in detector_results
+    ]
+    return detectors, list(slither.source_code)
+
+
+def _run_project_in_process(root: str) -> Optional[Tuple[List[Dict[str, Any]], List[str]]]:
+    """
+    Run the detectors over a project through the Slither API in a worker process.
+    
+    The worker keeps the pure-Python detector phase off this process's GIL,
+    so per-file CLI runs proceed alongside it, and it can be killed when the
+    analysis exceeds SLITHER_TIMEOUT.
+    
+    Args:
+        root: Path to the project directory
         
-        if result.returncode == 0:
-            # Success, but might have empty output - try to parse anyway
-            if result.stdout.strip():
-                try:
-                    data = json.loads(result.stdout)
-                except json.JSONDecodeError:
-                    # Empty output means no issues
-                    return {
-                        "vulnerabilities": [],
-                        "inefficiencies": [],
-                        "best_practices": []
-                    }
-            else:
-                # Empty output means no issues
-                return {
-                    "vulnerabilities": [],
-                    "inefficiencies": [],
-                    "best_practices": []
-                }
-        elif result.returncode == 255:
-            # Issues found - parse the JSON output
-            if result.stdout.strip():
-                try:
-                    data = json.loads(result.stdout)
-                except json.JSONDecodeError:
-                    return {
-                        "error": _parse_slither_error(result.stderr, result.stdout, result.returncode)
-                    }
-            else:
-                return {
-                    "vulnerabilities": [],
-                    "inefficiencies": [],
-                    "best_practices": []
-                }
-        else:
-            # Error occurred (return code 1 or other)
-            error_msg = _parse_slither_error(result.stderr, result.stdout, result.returncode)
-            
-            # Try alternative: run without JSON flag to see if we can get any output
-            try:
-                alt_result = subprocess.run(
-                    ["slither", file_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
-                # If alternative run succeeds, we at least know the file is processable
-                if alt_result.returncode in (0, 255):
-                    # Return empty results but note there was an issue with JSON parsing
-                    return {
-                        "vulnerabilities": [],
-                        "inefficiencies": [],
-                        "best_practices": [],
-                        "warning": "Slither analysis completed but JSON parsing failed. Check output manually."
-                    }
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-            
-            return {"error": error_msg}
-
-        # Parse the JSON data (should be set by this point)
-        if not data:
-            return {
-                "vulnerabilities": [],
-                "inefficiencies": [],
-                "best_practices": []
+    Returns:
+        Tuple of (slimmed-down detector results, compiled source paths), or
+        None if Slither is not importable and the CLI should be used instead
+        
+    Raises:
+        subprocess.TimeoutExpired: If the analysis runs longer than SLITHER_TIMEOUT
+        Exception: Whatever the analysis raised in the worker
+    """
+    if not _slither_importable():
+        return None
+    
+    import multiprocessing
+    
+    # The worker is terminated when the pool exits, also after a timeout
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        analysis = pool.apply_async(_run_detectors_in_process, (root,))
+        try:
+            outcome: Tuple[List[Dict[str, Any]], List[str]] = analysis.get(timeout=SLITHER_TIMEOUT)
+        except multiprocessing.TimeoutError:
+            raise subprocess.TimeoutExpired(["slither", root], SLITHER_TIMEOUT)
+    return outcome
+
+
+def _execute_slither(
+    target: str,
+    retry_plain: bool = True,
+    list_sources: bool = False
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Run the Slither CLI on a file or directory and load its detector output.
+    
+    Args:
+        target: Path to a Solidity file or project directory
+        retry_plain: Whether to rerun Slither without JSON output after a
+            failure, to tell unparseable output apart from a failed analysis
+        list_sources: Whether to also report the compiled source files, under
+            the "sources" key of the parsed data
+        
+    Returns:
+        Tuple of (parsed JSON data, None) when there is output to process, or
+        (None, result) when the run already determines the final result
+    """
+    cmd = ["slither", target, "--json", "-"]
+    if list_sources:
+        cmd += ["--json-types", "detectors,compilations"]
+    output = process.run_streaming(
+        cmd,
+        _load_project_output if list_sources else _load_detectors,
+        parse_errors=_JSON_ERRORS,
+        timeout=SLITHER_TIMEOUT
+    )
+    
+    returncode = output.returncode
+    stdout_text = output.stdout_head
+    stderr_text = output.stderr
+
+    # Slither exit codes:
+    # 0: Success, no issues found
+    # 255: Success, issues found (this is the default for --json)
+    # 1: Error occurred
+    # Other: Various errors
+    
+    if returncode in (0, 255):
+        if output.parse_failed:
+            # Empty or unparseable output on a clean run means no issues
+            if returncode == 0 or not stdout_text.strip():
+                return None, _empty_findings()
+            return None, {
+                "error": _parse_slither_error(stderr_text, stdout_text, returncode)
             }
+        if list_sources:
+            detectors, sources = output.value
+            return {"results": {"detectors": detectors}, "sources": sources}, None
+        if not output.value:
+            return None, _empty_findings()
+        return {"results": {"detectors": output.value}}, None
+    
+    # Error occurred (return code 1 or other)
+    error_msg = _parse_slither_error(stderr_text, stdout_text, returncode)
+    if not retry_plain:
+        return None, {"error": error_msg}
+    
+    # Try alternative: run without JSON flag to see if we can get any output
+    try:
+        # Only the exit code matters, so discard the output instead of buffering it
+        alt_returncode = process.run_quiet(["slither", target], timeout=SLITHER_TIMEOUT)
+        # If alternative run succeeds, we at least know the file is processable
+        if alt_returncode in (0, 255):
+            # Return empty results but note there was an issue with JSON parsing
+            findings: Dict[str, Any] = _empty_findings()
+            findings["warning"] = "Slither analysis completed but JSON parsing failed. Check output manually."
+            return None, findings
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        pass
+    
+    return None, {"error": error_msg}
 
-        results = []
-        for detector in data.get("results", {}).get("detectors", []):
-            description = detector.get("description", "")
-            impact = detector.get("impact", "Info")
-            elements = detector.get("elements", [])
-            for element in elements:
-                source_mapping = element.get("source_mapping", {})
-                location = (
-                    f"{source_mapping.get('filename_short', file_path)}:"
-                    f"{source_mapping.get('lines', '?')}"
-                )
-                results.append({
-                    "issue": description,
-                    "severity": impact,
-                    "location": location,
-                    "category": _categorize_issue(description)
-                })
-
-        return {
-            "vulnerabilities": [r for r in results if r["category"] == "vulnerability"],
-            "inefficiencies": [r for r in results if r["category"] == "inefficiency"],
-            "best_practices": [r for r in results if r["category"] == "best_practice"]
-        }
 
+def _iter_details(data: Dict[str, Any], default_file: str):
+    """
+    Yield (source_mapping, details) pairs for every detector element in Slither output.
+    
+    Details are (description, impact, filename, lines) tuples, the input
+    expected by _classify.
+    
+    Args:
+        data: Parsed Slither JSON output
+        default_file: File name to use when an element has no source mapping
+    """
+    for detector in data.get("results", {}).get("detectors", []):
+        description = detector.get("description", "")
+        impact = detector.get("impact", "Info")
+        elements = detector.get("elements", [])
+        for element in elements:
+            source_mapping = element.get("source_mapping", {})
+            yield source_mapping, (
+                description,
+                impact,
+                source_mapping.get("filename_short", default_file),
+                source_mapping.get("lines", "?")
+            )
+
+
+def _classify(details: List[Tuple[str, str, Any, Any]]) -> Tuple[List[Dict[str, Any]], ...]:
+    """
+    Build findings from detector details and split them by category.
+    
+    Uses the compiled _classify extension when it was built.
+    
+    Args:
+        details: (description, impact, filename, lines) tuples
+        
+    Returns:
+        Tuple of (vulnerabilities, inefficiencies, best_practices) lists
+    """
+    if _classify_compiled is not None:
+        classified: Tuple[List[Dict[str, Any]], ...] = _classify_compiled(details)
+        return classified
+    
+    buckets: Dict[str, List[Dict[str, Any]]] = {
+        "vulnerability": [],
+        "inefficiency": [],
+        "best_practice": []
+    }
+    for description, impact, filename, lines in details:
+        category = _categorize_issue(description)
+        buckets[category].append({
+            "issue": description,
+            "severity": impact,
+            "location": f"{filename}:{lines}",
+            "category": category
+        })
+    return buckets["vulnerability"], buckets["inefficiency"], buckets["best_practice"]
+
+
+def _bucket_findings(details: List[Tuple[str, str, Any, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Classify detector details into the result buckets."""
+    vulnerabilities, inefficiencies, best_practices = _classify(details)
+    return {
+        "vulnerabilities": vulnerabilities,
+        "inefficiencies": inefficiencies,
+        "best_practices": best_practices
+    }
+
+
+def _run_guarded(func: Callable[..., Dict[str, Any]], *args: Any) -> Dict[str, Any]:
+    """Call a Slither runner, converting expected failures into error results."""
+    try:
+        return func(*args)
     except json.JSONDecodeError as e:
         return {"error": f"Failed to parse Slither JSON output: {str(e)}"}
     except subprocess.TimeoutExpired:
@@ -183,21 +454,241 @@ def run_slither(file_path: str) -> Dict[str, Any]:
         return {"error": f"Unexpected error running Slither: {str(e)}"}
 
 
+def _analyze_file(file_path: str) -> Dict[str, Any]:
+    """Analyze a single Solidity file and bucket its findings."""
+    data, result = _execute_slither(file_path)
+    if result is not None:
+        return result
+    
+    # _execute_slither returns data whenever it has no final result
+    data = cast(Dict[str, Any], data)
+    return _bucket_findings([details for _, details in _iter_details(data, file_path)])
+
+
+def _analyze_project(root: str) -> Dict[str, Any]:
+    """
+    Analyze a project directory and bucket its findings per file.
+    
+    Only files that were compiled get an entry, files without findings an
+    empty one. Other files may not have been analyzed at all, so callers must
+    not treat them as clean.
+    
+    Returns:
+        Dictionary mapping real (symlink-resolved) file paths to findings, or
+        a dictionary with an "error" key on failure
+    """
+    in_process = _run_project_in_process(root)
+    if in_process is not None:
+        detectors, compiled = in_process
+        data: Optional[Dict[str, Any]] = {"results": {"detectors": detectors}}
+        result = None
+    else:
+        # A failed project run falls back to per-file analysis, which gives
+        # the detailed errors, so it is not retried without JSON output
+        data, result = _execute_slither(root, retry_plain=False, list_sources=True)
+        compiled = data["sources"] if data is not None else []
+    if result is not None:
+        # Warnings cannot be attributed to a single file, so treat them as
+        # failures and let the caller fall back to per-file analysis
+        if "error" in result or "warning" in result:
+            return {"error": result.get("error") or result["warning"]}
+        data = None
+    
+    details_by_file: Dict[str, List[Tuple[str, str, Any, Any]]] = {
+        os.path.realpath(filename): [] for filename in compiled
+    }
+    if data is not None:
+        for source_mapping, details in _iter_details(data, root):
+            filename = source_mapping.get("filename_absolute") or os.path.abspath(
+                source_mapping.get("filename_short", root)
+            )
+            details_by_file.setdefault(os.path.realpath(filename), []).append(details)
+    
+    return {filename: _bucket_findings(details) for filename, details in details_by_file.items()}
+
+
+def _import_closure(file_path: str) -> Optional[List[str]]:
+    """
+    Return a file and every file it imports, directly or indirectly.
+    
+    Only relative imports ("./" or "../") can be resolved without the
+    compiler's remappings.
+    
+    Args:
+        file_path: Path to the Solidity file
+        
+    Returns:
+        Absolute paths of the files, or None if a file has an import that
+        is not relative or cannot be read
+    """
+    closure = [os.path.abspath(file_path)]
+    seen = set(closure)
+    for current in closure:
+        try:
+            with open(current, "rb") as f:
+                source = f.read()
+        except OSError:
+            return None
+        for match in _IMPORT_RE.finditer(source):
+            target = match.group(1).decode("utf-8", errors="replace")
+            if not target.startswith(("./", "../")):
+                return None
+            imported = os.path.normpath(os.path.join(os.path.dirname(current), target))
+            if imported not in seen:
+                seen.add(imported)
+                closure.append(imported)
+    return closure
+
+
+def project_digest(file_paths: Iterable[str]) -> str:
+    """
+    Digest the files of a project for the Slither cache keys of a project audit.
+    
+    Findings in one file depend on the files it imports or inherits from, so
+    project-mode results are keyed on every file of the project and a change
+    to any of them invalidates them all.
+    
+    Args:
+        file_paths: Paths of all Solidity files discovered in the project
+        
+    Returns:
+        Hex digest, or an empty string when caching is disabled
+    """
+    if not cache.is_enabled():
+        return ""
+    return cache.files_digest(file_paths)
+
+
+def _slither_cache_key(file_path: str, project: Optional[str]) -> Optional[str]:
+    """
+    Compute the Slither cache key for a file in file or project mode.
+    
+    The modes report different findings for the same file (a single-file run
+    also reports findings located in imported files, a project run attributes
+    them to those files), so their results are cached separately. Both cover
+    the files the findings depend on: the project's files in project mode,
+    the file's imports in file mode. A file with imports that cannot be
+    followed is not cached in file mode.
+    
+    Args:
+        file_path: Path to the Solidity file
+        project: Digest from project_digest() for a project audit, or None
+            for a single-file audit
+    """
+    if project is not None:
+        return cache.cache_key("slither", file_path, _PROJECT_MODE + project.encode("ascii"))
+    
+    if not cache.is_enabled():
+        return None
+    closure = _import_closure(file_path)
+    if closure is None:
+        return None
+    return cache.cache_key("slither", file_path, _FILE_MODE + cache.files_digest(closure).encode("ascii"))
+
+
+def load_cached_slither(file_path: str, project: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached Slither result for a file, or None on a miss.
+    
+    Args:
+        file_path: Path to the Solidity file
+        project: Digest from project_digest() to look up the result of a
+            project audit, or None for a single-file audit
+    """
+    return cache.load("slither", _slither_cache_key(file_path, project))
+
+
+def _run_cached(file_path: str, project: Optional[str]) -> Dict[str, Any]:
+    """Analyze one file on its own, caching the result under the given mode."""
+    key = _slither_cache_key(file_path, project)
+    result = cache.load("slither", key)
+    if result is None:
+        result = _run_guarded(_analyze_file, file_path)
+        cache.save("slither", key, result)
+    return result
+
+
+def run_slither(file_path: str) -> Dict[str, Any]:
+    """
+    Run Slither using CLI output and return parsed findings.
+    
+    Args:
+        file_path: Path to the Solidity file to analyze
+        
+    Returns:
+        Dictionary containing vulnerabilities, inefficiencies, and best practices
+    """
+    return _run_cached(file_path, None)
+
+
+def run_slither_in_project(file_path: str, project: str) -> Dict[str, Any]:
+    """
+    Analyze one file of a project audit on its own.
+    
+    Used for files the project-wide run did not cover, or all pending files
+    when it failed. The result is cached as the file's project-mode result,
+    so later audits of the project report the same findings for it.
+    
+    Args:
+        file_path: Path to the Solidity file to analyze
+        project: Digest from project_digest() of the audited project
+        
+    Returns:
+        Dictionary containing vulnerabilities, inefficiencies, and best practices
+    """
+    return _run_cached(file_path, project)
+
+
+def run_slither_batch(root: str, files: Iterable[str], project: str) -> Dict[str, Any]:
+    """
+    Run Slither once over a whole project directory and split findings per file.
+    
+    Compiling the project a single time avoids re-parsing shared imports for
+    every file, which dominates runtime on multi-file projects. Each file's
+    findings are cached as its project-mode result.
+    
+    Args:
+        root: Path to the project directory to analyze
+        files: Paths of the files under root to report findings for
+        project: Digest from project_digest() of the audited project
+        
+    Returns:
+        Dictionary mapping paths in files to their findings (findings in other
+        files are dropped), or a dictionary with an "error" key on failure.
+        Files the run is not known to have compiled are left out; analyze them
+        with run_slither_in_project.
+    """
+    grouped = _run_guarded(_analyze_project, root)
+    if "error" in grouped:
+        return grouped
+    
+    all_results: Dict[str, Any] = {}
+    for file_path in files:
+        result = grouped.get(os.path.realpath(file_path))
+        if result is None:
+            continue
+        cache.save("slither", _slither_cache_key(file_path, project), result)
+        all_results[file_path] = result
+    
+    return all_results
+
+
+@functools.lru_cache(maxsize=2048)
 def _categorize_issue(description: str) -> str:
     """
     Categorize an issue based on its description.
     
+    Cached because the same detector descriptions recur across contracts.
+    
     Args:
         description: Issue description
         
     Returns:
         Category string: "vulnerability", "inefficiency", or "best_practice"
     """
-    desc_lower = description.lower()
-    if "reentrancy" in desc_lower or "vulnerability" in desc_lower:
+    if _VULN_RE.search(description):
         return "vulnerability"
-    elif "gas" in desc_lower or "optimization" in desc_lower:
+    if _INEFF_RE.search(description):
         return "inefficiency"
-    else:
-        return "best_practice"
+    return "best_practice"
 
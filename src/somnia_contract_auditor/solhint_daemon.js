@@ -0,0 +1,72 @@
+// Long-lived Solhint worker used by solhint_runner.py.
+//
+// Usage: node solhint_daemon.js <solhint package dir>
+//
+// Loads Solhint and its config loader once and prints {"ready": true}, or
+// {"ready": false, "error": "..."} if either cannot be loaded. Then reads one
+// JSON request per line on stdin, {"file": "...", "config": "..."}, and writes
+// one JSON line per request on stdout: {"messages": [...]} on success or
+// {"error": "..."} on failure. Each config is loaded the first time it is used
+// and then reused.
+
+'use strict'
+
+const path = require('path')
+const readline = require('readline')
+
+const [solhintDir] = process.argv.slice(2)
+
+const SEVERITY = { 2: 'Error', 3: 'Warning' }
+
+const configs = new Map()
+
+function loadSolhintConfig(configFile, configPath) {
+  if (!configs.has(configPath)) {
+    let config = configFile.loadConfig(configPath)
+    if (config.extends && typeof configFile.applyExtends === 'function') {
+      config = configFile.applyExtends(config)
+    }
+    configs.set(configPath, config)
+  }
+  return configs.get(configPath)
+}
+
+function lint(linter, configFile, request) {
+  const report = linter.processFile(request.file, loadSolhintConfig(configFile, request.config))
+  return {
+    messages: report.messages.map((message) => ({
+      line: message.line,
+      column: message.column,
+      severity: SEVERITY[message.severity] || 'Info',
+      message: message.message,
+      ruleId: message.ruleId
+    }))
+  }
+}
+
+function main() {
+  let linter
+  let configFile
+  try {
+    linter = require(path.join(solhintDir, 'lib', 'index.js'))
+    configFile = require(path.join(solhintDir, 'lib', 'config', 'config-file.js'))
+  } catch (err) {
+    process.stdout.write(JSON.stringify({ ready: false, error: String(err && err.message) }) + '\n')
+    process.exit(1)
+  }
+
+  process.stdout.write(JSON.stringify({ ready: true }) + '\n')
+
+  const input = readline.createInterface({ input: process.stdin, terminal: false })
+  input.on('line', (line) => {
+    let response
+    try {
+      response = lint(linter, configFile, JSON.parse(line))
+    } catch (err) {
+      response = { error: String(err && err.message) }
+    }
+    process.stdout.write(JSON.stringify(response) + '\n')
+  })
+}
+
+main()
@@ -1,10 +1,22 @@
 """Solhint analysis runner module."""
 
-import json
+import atexit
+import functools
+import hashlib
 import os
+import shutil
 import subprocess
+import sys
+import threading
+import weakref
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import IO, TYPE_CHECKING, DefaultDict, Dict, List, Any, Optional, Tuple, cast
+
+from . import cache, json_backend, process
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 # Default Solhint configuration
@@ -17,49 +29,174 @@ DEFAULT_SOLHINT_CONFIG = {
     }
 }
 
+# DEFAULT_SOLHINT_CONFIG as written to newly created config files
+_DEFAULT_CONFIG_BYTES = json_backend.dumps(DEFAULT_SOLHINT_CONFIG, indent=True)
 
-def _find_project_root(start_path: str) -> Path:
+# Shared copy of the default config used for projects without their own; the
+# name is derived from the contents, so every project reuses the same file
+_SHARED_CONFIG_PATH = cache.CACHE_DIR / "configs" / f"{hashlib.sha256(_DEFAULT_CONFIG_BYTES).hexdigest()[:16]}.json"
+
+# Maximum number of files passed to a single Solhint invocation
+SOLHINT_BATCH_SIZE = 500
+
+# Minimum number of files before run_solhint_parallel uses worker processes
+SOLHINT_PARALLEL_MIN_FILES = 100
+
+# Maximum number of Solhint processes arun_solhint runs at once per event loop
+SOLHINT_ASYNC_CONCURRENCY = os.cpu_count() or 1
+
+# Files larger than this are assumed to contain code without reading them
+_BLANK_CHECK_MAX_SIZE = 4096
+
+# Entries that mark a directory as a project root
+_PROJECT_ROOT_INDICATORS = frozenset({'.git', 'package.json', 'foundry.toml', 'hardhat.config.js', 'hardhat.config.ts'})
+
+# Shared severity and category strings, so findings do not each carry a copy
+_SEVERITIES = {
+    "error": sys.intern("Error"),
+    "warning": sys.intern("Warning"),
+    "info": sys.intern("Info"),
+    "off": sys.intern("Off")
+}
+_BEST_PRACTICE = sys.intern("best_practice")
+
+# Formats a (file, line, column) tuple as a finding location
+_format_location = "%s:%s:%s".__mod__
+
+# Node.js worker that keeps Solhint loaded between files
+_DAEMON_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solhint_daemon.js")
+
+# Semaphores limiting arun_solhint, one per event loop
+_async_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+# The running worker, shared by every config; started on first use
+_daemon: Optional["_SolhintDaemon"] = None
+_daemon_started = False
+_daemon_lock = threading.Lock()
+
+
+def _is_blank_source(file_path: str) -> bool:
     """
-    Find the project root by walking up from start_path.
-    Looks for indicators like .git, package.json, or .solhint.json.
+    Check whether a Solidity file is empty or only contains whitespace.
+    
+    Such files cannot produce findings, so Solhint (and its Node.js startup)
+    can be skipped for them. Comment-only files are still linted, since rules
+    such as max-line-length apply to comments too.
     
     Args:
-        start_path: Path to start searching from
+        file_path: Path to the Solidity file
         
     Returns:
-        Path to project root, or current directory if not found
+        True if the file is empty or only contains whitespace
+    """
+    try:
+        size = os.path.getsize(file_path)
+        if size == 0:
+            return True
+        if size > _BLANK_CHECK_MAX_SIZE:
+            return False
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            source = f.read()
+    except OSError:
+        # Let Solhint report unreadable files
+        return False
+    
+    return not source.strip()
+
+
+def _start_dir(start_path: str) -> str:
+    """
+    Normalize a search start path to the directory the walk begins in.
+    
+    Args:
+        start_path: File or directory path
+        
+    Returns:
+        Resolved directory path as a string
     """
     path = Path(start_path).resolve()
     
     # If it's a file, start from its parent directory
     if path.is_file():
         path = path.parent
+    return str(path)
+
+
+def _find_project_root(start_path: str) -> Path:
+    """
+    Find the project root by walking up from start_path.
+    Looks for indicators like .git, package.json, or .solhint.json.
+    
+    Args:
+        start_path: Path to start searching from
+        
+    Returns:
+        Path to project root, or current directory if not found
+    """
+    return _project_root_for_dir(_start_dir(start_path))
+
+
+@functools.lru_cache(maxsize=1024)
+def _project_root_for_dir(directory: str) -> Path:
+    """Walk up from a resolved directory for _find_project_root(); memoized per directory."""
+    path = Path(directory)
     
-    # Walk up the directory tree looking for project indicators
+    # Walk up the directory tree looking for project indicators, listing each
+    # directory once instead of probing every indicator separately
     for parent in [path] + list(path.parents):
-        # Check for common project root indicators
-        if any((parent / indicator).exists() for indicator in ['.git', 'package.json', 'foundry.toml', 'hardhat.config.js', 'hardhat.config.ts']):
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except (PermissionError, FileNotFoundError):
+            continue
+        if names & _PROJECT_ROOT_INDICATORS:
             return parent
     
     # If no indicators found, return the directory containing the file
     return path
 
 
-def _find_or_create_solhint_config(start_path: str) -> str:
+def _find_or_create_solhint_config(start_path: str) -> Optional[str]:
     """
     Find or create a .solhint.json config file.
     
+    Lookups are memoized per directory, so sibling files share one walk. A
+    remembered config that has since been deleted is looked up again.
+    
     Args:
         start_path: Path to start searching from
         
     Returns:
-        Path to .solhint.json config file
+        Path to .solhint.json config file, or None if there is no usable one
     """
-    path = Path(start_path).resolve()
+    directory = _start_dir(start_path)
+    config_path = _solhint_config_for_dir(directory)
+    if config_path is not None and not os.path.exists(config_path):
+        _solhint_config_for_dir.cache_clear()
+        config_path = _solhint_config_for_dir(directory)
     
-    # If it's a file, start from its parent directory
-    if path.is_file():
-        path = path.parent
+    # A config Solhint cannot parse would fail every run, so report it as
+    # missing and let Solhint run from the file's directory instead
+    if config_path is not None and not _is_valid_config(config_path):
+        return None
+    return config_path
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_config(config_path: str) -> bool:
+    """Return whether a config file can be read and parsed as JSON."""
+    try:
+        with open(config_path, 'rb') as f:
+            json_backend.loads(f.read())
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _solhint_config_for_dir(directory: str) -> Optional[str]:
+    """Find or create the config for _find_or_create_solhint_config(); memoized per directory."""
+    path = Path(directory)
     
     # First, try to find existing config
     for parent in [path] + list(path.parents):
@@ -67,27 +204,100 @@ def _find_or_create_solhint_config(start_path: str) -> str:
         if config_file.exists():
             return str(config_file)
     
-    # No config found - determine where to create it (project root)
-    project_root = _find_project_root(start_path)
+    # No config found - use the shared default rather than writing into the project
+    shared_config = _shared_default_config()
+    if shared_config is not None:
+        return shared_config
+    
+    # The cache directory is not writable - determine where to create it (project root)
+    project_root = _project_root_for_dir(directory)
     config_file = project_root / '.solhint.json'
     
     # Create the default config file
     try:
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(DEFAULT_SOLHINT_CONFIG, f, indent=2)
+        _write_default_config(config_file)
         return str(config_file)
     except (OSError, IOError):
         # If we can't write to project root, fall back to file's directory
         config_file = path / '.solhint.json'
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(DEFAULT_SOLHINT_CONFIG, f, indent=2)
+            _write_default_config(config_file)
             return str(config_file)
         except (OSError, IOError):
             # If we still can't write, return None and let solhint use defaults
             return None
 
 
+def _shared_default_config() -> Optional[str]:
+    """
+    Return the shared default config, creating it on first use.
+    
+    Returns:
+        Path to the shared config file, or None if it cannot be created
+    """
+    if _SHARED_CONFIG_PATH.exists():
+        return str(_SHARED_CONFIG_PATH)
+    
+    import tempfile
+    
+    try:
+        _SHARED_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent runs never read a
+        # partial config; any copy that wins the rename has the same contents
+        fd, tmp_path = tempfile.mkstemp(dir=_SHARED_CONFIG_PATH.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_DEFAULT_CONFIG_BYTES)
+            os.replace(tmp_path, _SHARED_CONFIG_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return None
+    return str(_SHARED_CONFIG_PATH)
+
+
+def _write_default_config(config_file: Path) -> None:
+    """
+    Create a config file holding the default Solhint config.
+    
+    The file is created exclusively, so a config another worker created in
+    the meantime is kept as is rather than rewritten.
+    
+    Args:
+        config_file: Path of the config file to create
+        
+    Raises:
+        OSError: If the file cannot be created
+    """
+    try:
+        fd = os.open(str(config_file), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return
+    try:
+        data = memoryview(_DEFAULT_CONFIG_BYTES)
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _read_config(config_path: Optional[str]) -> bytes:
+    """
+    Return the contents of a Solhint config file, or b"" if there is none.
+    
+    Args:
+        config_path: Path to the config file, or None
+    """
+    if not config_path:
+        return b""
+    try:
+        with open(config_path, "rb") as f:
+            return f.read()
+    except OSError:
+        return b""
+
+
 def run_solhint(file_path: str) -> Dict[str, Any]:
     """
     Run Solhint for best practices and return findings.
@@ -98,105 +308,506 @@ def run_solhint(file_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing best practices findings
     """
-    try:
-        # Get absolute path to file
-        abs_file_path = os.path.abspath(file_path)
-        file_dir = os.path.dirname(abs_file_path)
-        file_name = os.path.basename(abs_file_path)
-        
-        # Find or create a solhint config file
-        config_path = _find_or_create_solhint_config(abs_file_path)
-        
-        # Build solhint command
-        if config_path and os.path.exists(config_path):
-            # Use explicit config file
-            cmd = ["solhint", abs_file_path, "--formatter", "json", "--config", config_path]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-        else:
-            # Run from file's directory so solhint can find config relative to it
-            cmd = ["solhint", file_name, "--formatter", "json"]
-            result = subprocess.run(
-                cmd,
-                cwd=file_dir,
-                capture_output=True,
-                text=True,
-                check=True
+    return run_solhint_batch([file_path])[file_path]
+
+
+async def arun_solhint(file_path: str) -> Dict[str, Any]:
+    """
+    Run Solhint for best practices without blocking the event loop.
+    
+    Many calls can be awaited together with asyncio.gather; at most
+    SOLHINT_ASYNC_CONCURRENCY Solhint processes run at a time.
+    
+    Args:
+        file_path: Path to the Solidity file to analyze
+        
+    Returns:
+        Dictionary containing best practices findings
+    """
+    # Imported here so the CLI, which never runs Solhint this way, does not pay for asyncio
+    import asyncio
+    
+    if _is_blank_source(file_path):
+        return {"best_practices": []}
+    
+    cmd, cwd, config_path = _single_file_command(file_path)
+    key = cache.cache_key("solhint", file_path, _read_config(config_path))
+    cached_result = cache.load("solhint", key)
+    if cached_result is not None:
+        return cached_result
+    
+    loop = asyncio.get_running_loop()
+    limit = _async_limits.get(loop)
+    if limit is None:
+        limit = _async_limits[loop] = asyncio.Semaphore(SOLHINT_ASYNC_CONCURRENCY)
+    
+    async with limit:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-        findings = json.loads(result.stdout)
-        
-        # Solhint outputs a list, not an object with "issues"
-        if isinstance(findings, list):
-            issues = findings
-        else:
-            issues = findings.get("issues", [])
-
-        results = []
-        for issue in issues:
-            results.append({
-                "issue": issue.get("message", "Unknown issue"),
-                "severity": issue.get("severity", "info").capitalize(),
-                "location": (
-                    f"{issue.get('file', file_path)}:"
-                    f"{issue.get('line', '?')}:"
-                    f"{issue.get('column', '?')}"
-                ),
-                "category": "best_practice"
-            })
-
-        return {"best_practices": results}
-    
-    except subprocess.CalledProcessError as e:
-        # Check if it's a config file error - if so, try running from file directory without explicit config
-        stderr = e.stderr or ""
-        if "config" in stderr.lower() and ("failed to load" in stderr.lower() or "cannot read" in stderr.lower()):
-            try:
-                # Retry by running from file's directory (different from first attempt if we used explicit config)
-                abs_file_path = os.path.abspath(file_path)
-                file_dir = os.path.dirname(abs_file_path)
-                file_name = os.path.basename(abs_file_path)
-                result = subprocess.run(
-                    ["solhint", file_name, "--formatter", "json"],
-                    cwd=file_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                findings = json.loads(result.stdout)
-                
-                if isinstance(findings, list):
-                    issues = findings
-                else:
-                    issues = findings.get("issues", [])
-                
-                results = []
-                for issue in issues:
-                    results.append({
-                        "issue": issue.get("message", "Unknown issue"),
-                        "severity": issue.get("severity", "info").capitalize(),
-                        "location": (
-                            f"{issue.get('file', file_path)}:"
-                            f"{issue.get('line', '?')}:"
-                            f"{issue.get('column', '?')}"
-                        ),
-                        "category": "best_practice"
-                    })
-                
-                return {"best_practices": results}
-            except (subprocess.CalledProcessError, json.JSONDecodeError):
-                # If fallback also fails, return the original error
-                pass
-        
-        error_msg = f"Solhint failed: {str(e)}"
-        if stderr:
-            error_msg += f"\nSTDERR: {stderr}"
-        return {"error": error_msg}
-    except json.JSONDecodeError as e:
-        return {"error": f"Failed to parse Solhint JSON output: {str(e)}"}
+        except FileNotFoundError:
+            return {"error": "Solhint not found. Please install it: npm install -g solhint"}
+        stdout, stderr = await proc.communicate()
+    
+    findings = None
+    parse_failed = False
+    try:
+        findings = json_backend.loads(stdout)
+    except ValueError:
+        parse_failed = True
+    
+    result = _single_file_result(
+        file_path,
+        cmd,
+        process.StreamResult(
+            value=findings,
+            parse_failed=parse_failed,
+            returncode=proc.returncode or 0,
+            stdout_head=stdout[:process.STDOUT_HEAD_LIMIT].decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace")
+        )
+    )
+    cache.save("solhint", key, result)
+    return result
+
+
+def _single_file_command(file_path: str) -> Tuple[List[str], Optional[str], Optional[str]]:
+    """
+    Build the Solhint command for linting one file.
+    
+    Args:
+        file_path: Path to the Solidity file to analyze
+        
+    Returns:
+        Tuple of (command, working directory or None, config path or None)
+    """
+    abs_file_path = os.path.abspath(file_path)
+    
+    # Find or create a solhint config file; unusable configs come back as None
+    config_path = _find_or_create_solhint_config(abs_file_path)
+    if config_path and os.path.exists(config_path):
+        # Use explicit config file
+        return ["solhint", abs_file_path, "--formatter", "json", "--config", config_path], None, config_path
+    
+    # Run from file's directory so solhint can find config relative to it
+    cmd = ["solhint", os.path.basename(abs_file_path), "--formatter", "json"]
+    return cmd, os.path.dirname(abs_file_path), None
+
+
+def _single_file_result(file_path: str, cmd: List[str], output: process.StreamResult) -> Dict[str, Any]:
+    """
+    Turn the outcome of a single-file Solhint run into findings.
+    
+    Solhint exits non-zero whenever it reports an error-level issue, so the
+    run is judged by whether its output parses, not by the exit code.
+    
+    Args:
+        file_path: Path of the analyzed file
+        cmd: Command that was run
+        output: Parsed output, exit code and captured streams of the run
+        
+    Returns:
+        Dictionary containing best practices findings
+    """
+    if output.parse_failed or output.value is None:
+        if output.returncode != 0:
+            error_msg = f"Solhint failed: {str(subprocess.CalledProcessError(output.returncode, cmd))}"
+            if output.stderr:
+                error_msg += f"\nSTDERR: {output.stderr}"
+            return {"error": error_msg}
+        return {"error": "Failed to parse Solhint JSON output"}
+    
+    return {
+        "best_practices": [_best_practice(issue, file_path) for issue in _file_issues(output.value)]
+    }
+
+
+def _run_solhint_single(file_path: str) -> Dict[str, Any]:
+    """
+    Run a Solhint process for one file.
+    
+    Args:
+        file_path: Path to the Solidity file to analyze
+        
+    Returns:
+        Dictionary containing best practices findings
+    """
+    cmd, cwd, _ = _single_file_command(file_path)
+    try:
+        output = process.run_streaming(cmd, lambda stdout: json_backend.loads(stdout.read()), cwd=cwd)
     except FileNotFoundError:
         return {"error": "Solhint not found. Please install it: npm install -g solhint"}
+    return _single_file_result(file_path, cmd, output)
+
+
+def run_solhint_batch(file_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Run Solhint over many files with as few invocations as possible.
+    
+    Files sharing a config are linted by a single Solhint process so Node.js
+    startup is paid once per group instead of once per file.
+    
+    Args:
+        file_paths: Paths to the Solidity files to analyze
+        
+    Returns:
+        Dictionary mapping each input path to its best practices findings
+    """
+    all_results: Dict[str, Dict[str, Any]] = {}
+    cache_keys: Dict[str, Optional[str]] = {}
+    config_contents: Dict[Optional[str], bytes] = {}
+    
+    # Group files by the config Solhint should use for them
+    groups: Dict[Optional[str], List[str]] = {}
+    for file_path in file_paths:
+        if _is_blank_source(file_path):
+            all_results[file_path] = {"best_practices": []}
+            continue
+        
+        config_path = _find_or_create_solhint_config(os.path.abspath(file_path))
+        if not (config_path and os.path.exists(config_path)):
+            config_path = None
+        
+        # Results depend on the config as well as the file, so key on both
+        if config_path not in config_contents:
+            config_contents[config_path] = _read_config(config_path)
+        cache_keys[file_path] = cache.cache_key("solhint", file_path, config_contents[config_path])
+        cached_result = cache.load("solhint", cache_keys[file_path])
+        if cached_result is not None:
+            all_results[file_path] = cached_result
+            continue
+        
+        groups.setdefault(config_path, []).append(file_path)
+    
+    for config_path, group in groups.items():
+        if config_path is None:
+            # Without an explicit config Solhint must run from each file's directory
+            for file_path in group:
+                result = _run_solhint_single(file_path)
+                cache.save("solhint", cache_keys[file_path], result)
+                all_results[file_path] = result
+            continue
+        
+        # Keep the argument list well below ARG_MAX on large projects
+        for start in range(0, len(group), SOLHINT_BATCH_SIZE):
+            chunk = group[start:start + SOLHINT_BATCH_SIZE]
+            chunk_results = _run_solhint_daemon(chunk, config_path)
+            if chunk_results is None:
+                chunk_results = _run_solhint_chunk(chunk, config_path)
+            for file_path, result in chunk_results.items():
+                cache.save("solhint", cache_keys[file_path], result)
+                all_results[file_path] = result
+    
+    return all_results
+
+
+def run_solhint_parallel(file_paths: List[str], workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run Solhint over many files, spread across worker processes.
+    
+    Linting is CPU bound inside Node.js, so large audits are split into
+    round-robin shards that each run through run_solhint_batch in their own
+    process. Small audits run in this process.
+    
+    Args:
+        file_paths: Paths to the Solidity files to analyze
+        workers: Number of worker processes (default: CPU count)
+        
+    Returns:
+        Dictionary mapping each input path to its best practices findings
+    """
+    workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    if workers <= 1 or len(file_paths) < SOLHINT_PARALLEL_MIN_FILES:
+        return run_solhint_batch(file_paths)
+    
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # Create missing configs up front so workers never race to write them
+    for file_path in file_paths:
+        _find_or_create_solhint_config(os.path.abspath(file_path))
+    
+    # Round-robin shards spread large and small directories evenly
+    shards = [file_paths[i::workers] for i in range(workers)]
+    
+    all_results: Dict[str, Dict[str, Any]] = {}
+    # Spawned workers are safe to start from a process that is running threads.
+    # They import a fresh cache module, so pass on whether caching is enabled
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=cache.set_enabled,
+        initargs=(cache.is_enabled(),)
+    ) as executor:
+        for shard_results in executor.map(run_solhint_batch, shards):
+            all_results.update(shard_results)
+    
+    return all_results
+
+
+def _run_solhint_chunk(file_paths: List[str], config_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Run a single Solhint process over files sharing one config.
+    
+    Args:
+        file_paths: Paths to the Solidity files to analyze
+        config_path: Path to the .solhint.json config to use
+        
+    Returns:
+        Dictionary mapping each input path to its best practices findings
+    """
+    abs_paths = dict.fromkeys(os.path.abspath(file_path) for file_path in file_paths)
+    cmd = ["solhint", *abs_paths, "--formatter", "json", "--config", config_path]
+    
+    try:
+        # Output for hundreds of files can be large, so read it from the pipe
+        # instead of buffering a copy with capture_output
+        output = process.run_streaming(cmd, lambda stdout: json_backend.loads(stdout.read()))
+    except FileNotFoundError:
+        error = {"error": "Solhint not found. Please install it: npm install -g solhint"}
+        return {file_path: dict(error) for file_path in file_paths}
+    
+    # Solhint exits non-zero when it reports errors, so judge by the output
+    if output.parse_failed:
+        # Let the per-file path handle config retries and error reporting
+        return {file_path: _run_solhint_single(file_path) for file_path in file_paths}
+    
+    issues_by_file: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for issue in _file_issues(output.value):
+        issues_by_file[os.path.abspath(issue.get("filePath") or issue["file"])].append(issue)
+    
+    return {
+        file_path: {
+            "best_practices": [
+                _best_practice(issue, file_path)
+                for issue in issues_by_file.get(os.path.abspath(file_path), [])
+            ]
+        }
+        for file_path in file_paths
+    }
+
 
+def _file_issues(findings: Any) -> List[Dict[str, Any]]:
+    """
+    Return the issues in Solhint's JSON output that belong to a file.
+    
+    Every path that runs the Solhint CLI filters its output with this, so
+    they all cache the same result for a file.
+    
+    Args:
+        findings: Parsed JSON output of the Solhint CLI
+        
+    Returns:
+        List of issues as reported by Solhint
+    """
+    # Solhint outputs a list, not an object with "issues"
+    if isinstance(findings, list):
+        issues = findings
+    else:
+        issues = findings.get("issues", [])
+    
+    # Entries without a file (such as the summary line) cannot be attributed
+    return [issue for issue in issues if issue.get("filePath") or issue.get("file")]
+
+
+def _best_practice(issue: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+    """
+    Convert a Solhint issue into a best practices finding.
+    
+    Args:
+        issue: Issue as reported by Solhint
+        file_path: Path of the file the issue belongs to
+        
+    Returns:
+        Finding dictionary
+    """
+    return {
+        "issue": issue.get("message", "Unknown issue"),
+        "severity": _severity(issue.get("severity")),
+        "location": _format_location((file_path, issue.get("line", "?"), issue.get("column", "?"))),
+        "category": _BEST_PRACTICE
+    }
+
+
+def _severity(severity: Optional[str]) -> str:
+    """Capitalize a Solhint severity, reusing the shared string for known levels."""
+    severity = severity or "info"
+    return _SEVERITIES.get(severity.lower()) or severity.capitalize()
+
+
+def _find_solhint_package() -> Optional[str]:
+    """
+    Locate the installed Solhint package directory.
+    
+    Returns:
+        Path to the package, or None if it cannot be found
+    """
+    executable = shutil.which("solhint")
+    if executable is None:
+        return None
+    
+    candidates = [
+        # npm links the executable to solhint.js inside the package
+        os.path.dirname(os.path.realpath(executable)),
+        # Windows shims sit next to a node_modules directory instead
+        os.path.join(os.path.dirname(executable), "node_modules", "solhint"),
+    ]
+    for candidate in candidates:
+        if os.path.isfile(os.path.join(candidate, "lib", "index.js")):
+            return candidate
+    return None
+
+
+class _SolhintDaemon:
+    """Node.js process that lints files with one loaded Solhint instance."""
+    
+    def __init__(self, proc: subprocess.Popen):
+        self._proc = proc
+        # Both pipes are opened by start()
+        self._stdin = cast(IO[bytes], proc.stdin)
+        self._stdout = cast(IO[bytes], proc.stdout)
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def start(cls) -> Optional["_SolhintDaemon"]:
+        """
+        Launch a worker.
+        
+        Returns:
+            The running worker, or None if Node.js or Solhint is unavailable
+        """
+        node = shutil.which("node")
+        solhint_dir = _find_solhint_package()
+        if node is None or solhint_dir is None or not os.path.isfile(_DAEMON_SCRIPT):
+            return None
+        
+        try:
+            proc = subprocess.Popen(
+                [node, _DAEMON_SCRIPT, solhint_dir],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return None
+        
+        daemon = cls(proc)
+        handshake = daemon._read_response()
+        if not handshake or not handshake.get("ready"):
+            daemon.close()
+            return None
+        return daemon
+    
+    def _read_response(self) -> Optional[Dict[str, Any]]:
+        line = self._stdout.readline()
+        if not line:
+            return None
+        try:
+            response: Dict[str, Any] = json_backend.loads(line)
+        except ValueError:
+            return None
+        return response
+    
+    def lint(self, file_path: str, config_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Lint one file.
+        
+        Args:
+            file_path: Path to the Solidity file to analyze
+            config_path: Path to the .solhint.json config to lint with
+            
+        Returns:
+            The worker's response, or None if the worker is no longer usable
+        """
+        request = json_backend.dumps({"file": os.path.abspath(file_path), "config": config_path})
+        
+        with self._lock:
+            try:
+                self._stdin.write(request + b"\n")
+                self._stdin.flush()
+            except OSError:
+                return None
+            return self._read_response()
+    
+    def close(self) -> None:
+        """Stop the worker."""
+        try:
+            self._stdin.close()
+        except OSError:
+            pass
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._stdout.close()
+
+
+def _get_daemon() -> Optional[_SolhintDaemon]:
+    """Return the worker, starting it on first use."""
+    global _daemon, _daemon_started
+    with _daemon_lock:
+        if not _daemon_started:
+            _daemon_started = True
+            _daemon = _SolhintDaemon.start()
+            if _daemon is not None:
+                atexit.register(_close_daemon)
+        return _daemon
+
+
+def _close_daemon() -> None:
+    """Stop the worker if it is running."""
+    global _daemon
+    with _daemon_lock:
+        if _daemon is not None:
+            _daemon.close()
+            _daemon = None
+
+
+def _run_solhint_daemon(file_paths: List[str], config_path: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Lint files sharing one config with the long-lived Solhint worker.
+    
+    Node.js and Solhint are loaded once per session, and each config once per
+    worker, so each further file only costs parsing and linting.
+    
+    Args:
+        file_paths: Paths to the Solidity files to analyze
+        config_path: Path to the .solhint.json config to use
+        
+    Returns:
+        Dictionary mapping each input path to its best practices findings, or
+        None if no worker is available and the CLI should be used instead.
+        Files the worker cannot lint are run through the CLI.
+    """
+    daemon = _get_daemon()
+    if daemon is None:
+        return None
+    
+    all_results: Dict[str, Dict[str, Any]] = {}
+    errored_files: List[str] = []
+    for file_path in file_paths:
+        response = daemon.lint(file_path, config_path)
+        if response is None:
+            # The worker died; stop it so later chunks go to the CLI
+            _close_daemon()
+            return None
+        
+        if "error" in response:
+            # The worker only uses part of Solhint's API, so let the CLI
+            # decide whether the file really fails
+            errored_files.append(file_path)
+            continue
+        
+        all_results[file_path] = {
+            "best_practices": [_best_practice(issue, file_path) for issue in response.get("messages", [])]
+        }
+    
+    if errored_files:
+        all_results.update(_run_solhint_chunk(errored_files, config_path))
+    return all_results